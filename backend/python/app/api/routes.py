@@ -19,12 +19,29 @@ DESIGN DECISIONS:
    - Clear error messages
    - Appropriate HTTP status codes
    - Consistent error response format
+
+4. Trusted Responses:
+   - Response models are built with Model.model_construct(...)
+   - It skips Pydantic's validation step, which is safe here because
+     every value comes from our own game logic, not from the client
 """
 
+import asyncio
+import threading
 import time
 import random
-from typing import Optional
-from fastapi import APIRouter, HTTPException, status
+from functools import lru_cache
+from typing import Optional, Tuple
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    status,
+)
+from fastapi.responses import ORJSONResponse, Response
 
 from app.api.schemas import (
     NewGameRequest,
@@ -40,29 +57,59 @@ from app.api.schemas import (
     TrainingEstimateRequest,
     TrainingEstimateResponse,
     HistoryResponse,
-    HistorySnapshotResponse,
     PlayerSymbol,
     GameStatus,
     GameResultType,
 )
-from app.core.board import Board, Player
-from app.core.game import Game, GameManager
+from app.core.board import GameResult, Player
+from app.core.game import GameManager, GameState, GameView
 from app.core.menace import Menace
+from app.core.training import play_training_game
 
 # Create the API router
 # All routes defined here will be prefixed with /api in main.py
 router = APIRouter()
 
 # ============================================================================
-# Global State (temporary - will move to database later)
+# Shared State (temporary - will move to database later)
 # ============================================================================
 
-# Create a single MENACE instance that persists across requests
-# In production, this would be loaded from a database
-menace_instance = Menace(player=Player.X)
 
-# Game manager to track active games
-game_manager = GameManager(menace=menace_instance)
+# A single MENACE instance and game manager persist across requests.
+# Endpoints receive them through FastAPI's dependency injection:
+#
+#     async def endpoint(menace: Menace = Depends(get_menace)): ...
+#
+# lru_cache makes each provider build its object once and then hand back
+# the same one on every call. Resetting MENACE is just clearing the caches.
+@lru_cache(maxsize=1)
+def get_menace() -> Menace:
+    """Provide the shared MENACE instance."""
+    # In production, this would be loaded from a database
+    return Menace(player=Player.X)
+
+
+@lru_cache(maxsize=1)
+def get_game_manager(menace: Menace = Depends(get_menace)) -> GameManager:
+    """Provide the game manager for the shared MENACE instance."""
+    return GameManager(menace=menace)
+
+
+# Self-play training runs in a worker thread (so it doesn't freeze the
+# server), which means it can touch MENACE at the same time as a request.
+# Anything that changes MENACE - or loops over its matchboxes/games - holds
+# this lock. Training takes it one game at a time, so requests only ever
+# wait for a single game to finish.
+menace_lock = threading.Lock()
+
+# Cached JSON body of /menace/matchboxes as (menace, version, body_bytes).
+# Rebuilt only when MENACE's matchboxes have changed since the last call.
+_matchbox_list_cache: Optional[tuple] = None
+
+# Bumped by /menace/reset. A fresh MENACE starts back at version 0, so the
+# ETags below include this to tell "version 3 before the reset" apart from
+# "version 3 after it".
+_menace_generation = 0
 
 
 # ============================================================================
@@ -75,30 +122,56 @@ def get_player_symbol(player: Player) -> PlayerSymbol:
     return PlayerSymbol.X if player == Player.X else PlayerSymbol.O
 
 
-def get_game_status(game: Game) -> GameStatus:
+def get_game_status(view: GameView) -> GameStatus:
     """Convert internal game state to API GameStatus."""
-    if game.is_over():
-        return GameStatus.FINISHED
-    elif game.is_menace_turn():
-        return GameStatus.WAITING_FOR_MENACE
-    else:
-        return GameStatus.WAITING_FOR_OPPONENT
+    # GameState and GameStatus share the same string values
+    return GameStatus(view.state.value)
 
 
-def get_result_type(game: Game) -> Optional[GameResultType]:
+def get_result_type(view: GameView) -> Optional[GameResultType]:
     """Get the game result as API type."""
-    if not game.is_over():
+    if view.result is None:
         return None
-    result = game.get_result()
-    return GameResultType(result.value)
+    return GameResultType(view.result.value)
 
 
-def get_winner(game: Game) -> Optional[PlayerSymbol]:
+def get_winner(view: GameView) -> Optional[PlayerSymbol]:
     """Get the winner as API type."""
-    winner = game.board.check_winner()
-    if winner is None:
+    if view.winner is None:
         return None
-    return get_player_symbol(winner)
+    return get_player_symbol(view.winner)
+
+
+# HTTP caching for the read-only MENACE endpoints.
+#
+# Their answers only change when MENACE does, and MENACE's version counter
+# tells us exactly when that is. Responses carry it as an ETag; a client
+# that sends it back in If-None-Match gets an empty 304 Not Modified
+# instead of the full body, so polling dashboards cost almost nothing.
+# "private, max-age=1" lets the browser reuse a response for a second
+# without asking at all.
+CACHE_CONTROL = "private, max-age=1"
+
+
+def get_menace_etag(menace: Menace = Depends(get_menace)) -> str:
+    """Provide the ETag for MENACE's current state."""
+    # Weak ("W/") because equal tags mean equal data, not identical bytes
+    return 'W/"%d-%d"' % (_menace_generation, menace.version)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header already names this ETag."""
+    if if_none_match is None:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Build an empty 304 response for a client that is already up to date."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
 
 
 # ============================================================================
@@ -122,33 +195,45 @@ def get_winner(game: Game) -> Optional[PlayerSymbol]:
     """,
     tags=["Game"],
 )
-async def new_game(request: NewGameRequest) -> NewGameResponse:
+async def new_game(
+    request: NewGameRequest,
+    manager: GameManager = Depends(get_game_manager),
+) -> NewGameResponse:
     """Create a new game session."""
 
-    # Create the game
-    game = game_manager.create_game(menace_plays_first=request.menace_plays_first)
-
     menace_move: Optional[int] = None
 
-    # If MENACE plays first, make the opening move
-    if request.menace_plays_first:
-        position, _ = game.menace_move()
-        menace_move = position
+    with menace_lock:
+        # Create the game
+        game = manager.create_game(
+            menace_plays_first=request.menace_plays_first
+        )
+
+        # If MENACE plays first, make the opening move
+        if request.menace_plays_first:
+            position, _ = game.menace_move()
+            menace_move = position
 
-    return NewGameResponse(
+    view = game.snapshot()
+
+    return NewGameResponse.model_construct(
         game_id=game.id,
-        board=game.board.state,
+        board=view.board,
         current_turn=get_player_symbol(game.current_turn),
         menace_player=get_player_symbol(game.menace_player),
-        status=get_game_status(game),
-        valid_moves=game.get_valid_moves(),
+        status=get_game_status(view),
+        valid_moves=list(view.valid_moves),
         menace_move=menace_move,
     )
 
 
 @router.post(
     "/game/{game_id}/move",
-    response_model=MoveResponse,
+    # Hot endpoint: we return the JSON ourselves, so FastAPI doesn't
+    # validate the result against a response model. `responses` keeps
+    # MoveResponse in the docs.
+    response_model=None,
+    responses={200: {"model": MoveResponse}},
     summary="Make a move",
     description="""
     Submit the opponent's (human's) move and get MENACE's response.
@@ -168,65 +253,77 @@ async def new_game(request: NewGameRequest) -> NewGameResponse:
     """,
     tags=["Game"],
 )
-async def make_move(game_id: str, request: MoveRequest) -> MoveResponse:
+async def make_move(
+    game_id: str,
+    request: MoveRequest,
+    manager: GameManager = Depends(get_game_manager),
+) -> ORJSONResponse:
     """Process a move from the opponent."""
 
     # Get the game
-    game = game_manager.get_game(game_id)
+    game = manager.get_game(game_id)
     if game is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Game not found: {game_id}"
         )
 
+    view = game.snapshot()
+
     # Check if game is already over
-    if game.is_over():
+    if view.is_over:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Game is already over"
         )
 
     # Check if it's opponent's turn
-    if not game.is_opponent_turn():
+    if view.state != GameState.WAITING_FOR_OPPONENT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="It's not your turn - waiting for MENACE",
         )
 
     # Validate move
-    if request.position not in game.get_valid_moves():
+    if request.position not in view.valid_moves:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid move: position {request.position} is not available. Valid moves: {game.get_valid_moves()}",
+            detail=f"Invalid move: position {request.position} is not available. Valid moves: {list(view.valid_moves)}",
         )
 
-    # Make opponent's move
-    try:
-        game.opponent_move(request.position)
-    except ValueError as e:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
-
     menace_move: Optional[int] = None
 
-    # If game continues and it's MENACE's turn, let MENACE respond
-    if not game.is_over() and game.is_menace_turn():
-        position, _ = game.menace_move()
-        menace_move = position
-
-    # If game ended, apply learning
-    if game.is_over():
-        game_manager.finish_game(game_id)
-
-    return MoveResponse(
-        board=game.board.state,
-        current_turn=(
-            get_player_symbol(game.current_turn) if not game.is_over() else None
-        ),
-        status=get_game_status(game),
-        valid_moves=game.get_valid_moves(),
-        opponent_move=request.position,
-        menace_move=menace_move,
-        is_game_over=game.is_over(),
-        result=get_result_type(game),
-        winner=get_winner(game),
+    with menace_lock:
+        # Make opponent's move
+        try:
+            game.opponent_move(request.position)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+            )
+
+        # If game continues and it's MENACE's turn, let MENACE respond
+        if game.snapshot().state == GameState.WAITING_FOR_MENACE:
+            position, _ = game.menace_move()
+            menace_move = position
+
+        view = game.snapshot()
+
+        # If game ended, apply learning
+        if view.is_over:
+            manager.finish_game(game_id)
+
+    # Same fields as MoveResponse, as plain JSON-ready values
+    return ORJSONResponse(
+        {
+            "board": view.board,
+            "current_turn": None if view.is_over else game.current_turn.value,
+            "status": view.state.value,
+            "valid_moves": view.valid_moves,
+            "opponent_move": request.position,
+            "menace_move": menace_move,
+            "is_game_over": view.is_over,
+            "result": None if view.result is None else view.result.value,
+            "winner": None if view.winner is None else view.winner.value,
+        }
     )
 
 
@@ -237,27 +334,32 @@ async def make_move(game_id: str, request: MoveRequest) -> MoveResponse:
     description="Retrieve the current state of a game.",
     tags=["Game"],
 )
-async def get_game_state(game_id: str) -> GameStateResponse:
+async def get_game_state(
+    game_id: str,
+    manager: GameManager = Depends(get_game_manager),
+) -> GameStateResponse:
     """Get the current state of a game."""
 
-    game = game_manager.get_game(game_id)
+    game = manager.get_game(game_id)
     if game is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Game not found: {game_id}"
         )
 
-    return GameStateResponse(
+    view = game.snapshot()
+
+    return GameStateResponse.model_construct(
         game_id=game.id,
-        board=game.board.state,
+        board=view.board,
         current_turn=(
-            get_player_symbol(game.current_turn) if not game.is_over() else None
+            get_player_symbol(game.current_turn) if not view.is_over else None
         ),
         menace_player=get_player_symbol(game.menace_player),
-        status=get_game_status(game),
-        valid_moves=game.get_valid_moves(),
-        is_game_over=game.is_over(),
-        result=get_result_type(game),
-        winner=get_winner(game),
+        status=get_game_status(view),
+        valid_moves=list(view.valid_moves),
+        is_game_over=view.is_over,
+        result=get_result_type(view),
+        winner=get_winner(view),
         move_count=len(game.moves),
     )
 
@@ -269,7 +371,9 @@ async def get_game_state(game_id: str) -> GameStateResponse:
 
 @router.get(
     "/menace/stats",
-    response_model=MenaceStatsResponse,
+    # Hot endpoint (polled by the frontend) - see make_move above
+    response_model=None,
+    responses={200: {"model": MenaceStatsResponse}},
     summary="Get MENACE statistics",
     description="""
     Get MENACE's learning statistics.
@@ -282,19 +386,22 @@ async def get_game_state(game_id: str) -> GameStateResponse:
     """,
     tags=["MENACE"],
 )
-async def get_menace_stats() -> MenaceStatsResponse:
+async def get_menace_stats(
+    menace: Menace = Depends(get_menace),
+    etag: str = Depends(get_menace_etag),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Get MENACE's learning statistics."""
 
-    stats = menace_instance.get_statistics()
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    with menace_lock:
+        stats = menace.get_statistics()
 
-    return MenaceStatsResponse(
-        games_played=stats["games_played"],
-        wins=stats["wins"],
-        losses=stats["losses"],
-        draws=stats["draws"],
-        win_rate=stats["win_rate"],
-        matchbox_count=stats["matchbox_count"],
-        total_beads=stats["total_beads"],
+    # MenaceStats has exactly the MenaceStatsResponse fields
+    return ORJSONResponse(
+        stats._asdict(), headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
     )
 
 
@@ -310,37 +417,36 @@ async def get_menace_stats() -> MenaceStatsResponse:
     """,
     tags=["MENACE"],
 )
-async def query_matchbox(request: MatchboxQueryRequest) -> MatchboxResponse:
+async def query_matchbox(
+    request: MatchboxQueryRequest,
+    menace: Menace = Depends(get_menace),
+) -> MatchboxResponse:
     """Get data about a specific matchbox."""
 
-    # Validate board state
-    try:
-        board = Board(request.board_state)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid board state: {e}"
-        )
-
-    # Get matchbox data
-    data = menace_instance.get_matchbox_data(request.board_state)
-
-    if data is None:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No matchbox found for state: {request.board_state}",
+    # Training may be changing this matchbox's beads in its worker thread;
+    # without the lock we could cache probabilities from half an update
+    with menace_lock:
+        # MatchboxQueryRequest has already checked the board state's format
+        found = menace.get_matchbox_data(request.board_state)
+
+        if found is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No matchbox found for state: {request.board_state}",
+            )
+
+        # Probabilities are cached on the matchbox until its beads change
+        matchbox, data = found
+        probs = matchbox.get_probabilities()
+
+        # data["beads"] is the matchbox's own dict, so copy it while locked
+        return MatchboxResponse.model_construct(
+            board_state=data["board_state"],
+            beads={str(k): v for k, v in data["beads"].items()},
+            times_used=data["times_used"],
+            probabilities={str(k): v for k, v in probs.items()},
         )
 
-    # Calculate probabilities
-    matchbox = menace_instance.matchboxes[data["board_state"]]
-    probs = matchbox.get_probabilities()
-
-    return MatchboxResponse(
-        board_state=data["board_state"],
-        beads={str(k): v for k, v in data["beads"].items()},
-        times_used=data["times_used"],
-        probabilities={str(k): v for k, v in probs.items()},
-    )
-
 
 @router.get(
     "/menace/matchboxes",
@@ -348,28 +454,58 @@ async def query_matchbox(request: MatchboxQueryRequest) -> MatchboxResponse:
     description="Get a list of all matchboxes MENACE has learned.",
     tags=["MENACE"],
 )
-async def list_matchboxes():
+async def list_matchboxes(
+    menace: Menace = Depends(get_menace),
+    etag: str = Depends(get_menace_etag),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """List all matchboxes."""
 
-    matchboxes = []
-    for state, mb in menace_instance.matchboxes.items():
-        probs = mb.get_probabilities()
-        # Find the position with most beads (the "favorite" move)
-        top_move = max(mb.beads.keys(), key=lambda k: mb.beads[k]) if mb.beads else None
-        matchboxes.append(
-            {
-                "board_state": state,
-                "beads": {str(k): v for k, v in mb.beads.items()},
-                "times_used": mb.times_used,
-                "total_beads": mb.get_total_beads(),
-                "top_move": top_move,
-            }
+    global _matchbox_list_cache
+
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+    # Serve the cached body if MENACE hasn't changed since it was built
+    cache = _matchbox_list_cache
+    if (
+        cache is not None
+        and cache[0] is menace
+        and cache[1] == menace.version
+    ):
+        return Response(
+            content=cache[2], media_type="application/json", headers=headers
         )
 
-    # Sort by times_used (most used first)
-    matchboxes.sort(key=lambda x: x["times_used"], reverse=True)
+    with menace_lock:
+        version = menace.version
+        matchboxes = []
+        for state, mb in menace.matchboxes.items():
+            matchboxes.append(
+                {
+                    "board_state": state,
+                    # orjson turns the int position keys into strings itself
+                    # (OPT_NON_STR_KEYS), so no need to rebuild the dict here
+                    "beads": mb.beads,
+                    "times_used": mb.times_used,
+                    "total_beads": mb.get_total_beads(),
+                    # The position with most beads (the "favorite" move)
+                    "top_move": mb.top_move,
+                }
+            )
+
+        # Sort by times_used (most used first)
+        matchboxes.sort(key=lambda x: x["times_used"], reverse=True)
+
+        # Render once with orjson and keep the bytes for the next request
+        response = ORJSONResponse(
+            {"count": len(matchboxes), "matchboxes": matchboxes}, headers=headers
+        )
 
-    return {"count": len(matchboxes), "matchboxes": matchboxes}
+    _matchbox_list_cache = (menace, version, response.body)
+    return response
 
 
 # ============================================================================
@@ -388,6 +524,11 @@ async def list_matchboxes():
     and win rate have changed over games played. Perfect for
     plotting learning curves.
     
+    Results can be paged: `since` skips that many snapshots and `limit`
+    caps how many are returned. Without `limit` every snapshot from
+    `since` on is returned, so the default is the whole history.
+    Compare with `total_snapshots` to know whether there is more to fetch.
+    
     **Why this is useful:**
     
     MENACE's beads represent "confidence" in moves. By tracking
@@ -399,29 +540,37 @@ async def list_matchboxes():
     """,
     tags=["MENACE"],
 )
-async def get_menace_history() -> HistoryResponse:
+async def get_menace_history(
+    since: int = Query(0, ge=0, description="Index of the first snapshot"),
+    limit: Optional[int] = Query(
+        None, ge=1, le=10000, description="Maximum snapshots to return (all if unset)"
+    ),
+    menace: Menace = Depends(get_menace),
+    etag: str = Depends(get_menace_etag),
+    if_none_match: Optional[str] = Header(None),
+) -> Response:
     """Get MENACE's learning history for graphing."""
 
-    raw_history = menace_instance.get_history()
-
-    # Convert raw dicts to HistorySnapshotResponse objects
-    history = [
-        HistorySnapshotResponse(
-            games=h["games"],
-            total_beads=h["total_beads"],
-            matchbox_count=h["matchbox_count"],
-            wins=h["wins"],
-            losses=h["losses"],
-            draws=h["draws"],
-            win_rate=h["win_rate"],
-        )
-        for h in raw_history
-    ]
-
-    return HistoryResponse(
-        history=history,
-        current_games=menace_instance.games_played,
-        current_beads=menace_instance.get_total_beads(),
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    # The snapshots are created by MENACE itself and already have exactly
+    # the HistorySnapshotResponse fields, so we hand them straight to orjson
+    # instead of building (and validating) one Pydantic object per snapshot.
+    # response_model=HistoryResponse above still documents the shape.
+    #
+    # A chart that already has the first N points can ask for ?since=N to
+    # fetch just the new ones. Clients that don't page get everything.
+    with menace_lock:
+        content = {
+            "history": menace.get_history(since, limit),
+            "total_snapshots": len(menace.history),
+            "current_games": menace.games_played,
+            "current_beads": menace.get_total_beads(),
+        }
+
+    return ORJSONResponse(
+        content, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
     )
 
 
@@ -439,64 +588,46 @@ async def get_menace_history() -> HistoryResponse:
     
     Opponent types:
     - `random`: Makes random valid moves (good for initial training)
-    - `optimal`: Uses minimax algorithm (for advanced training)
+    - `optimal`: Uses minimax algorithm (for advanced training) - not
+      implemented yet, plays like `random` for now
     
-    This runs synchronously - for many games, consider running in batches.
+    Training runs in a background worker thread, so the server keeps
+    answering other requests while it plays. For many games, consider
+    running in batches.
     """,
     tags=["Training"],
 )
-async def self_play_training(request: TrainingRequest) -> TrainingResponse:
+async def self_play_training(
+    request: TrainingRequest,
+    menace: Menace = Depends(get_menace),
+    manager: GameManager = Depends(get_game_manager),
+) -> TrainingResponse:
     """Run self-play training games."""
 
     start_time = time.time()
-    initial_matchboxes = menace_instance.get_matchbox_count()
-
-    wins = 0
-    losses = 0
-    draws = 0
-
-    for _ in range(request.num_games):
-        # Create a fresh game for training
-        # Alternate who goes first for variety
-        menace_first = random.choice([True, False])
-        game = game_manager.create_game(menace_plays_first=menace_first)
-
-        # Play the game
-        while not game.is_over():
-            if game.is_menace_turn():
-                game.menace_move()
-            else:
-                # Bot's turn - make a random move
-                valid_moves = game.get_valid_moves()
-                if valid_moves:
-                    if request.opponent == "random":
-                        move = random.choice(valid_moves)
-                    else:
-                        # TODO: Implement optimal (minimax) opponent
-                        move = random.choice(valid_moves)
-                    game.opponent_move(move)
-
-        # Apply learning
-        game_manager.finish_game(game.id)
-
-        # Track results
-        result = game.get_result()
-        if result.value == "win":
-            wins += 1
-        elif result.value == "loss":
-            losses += 1
-        else:
-            draws += 1
+    initial_matchboxes = menace.get_matchbox_count()
+
+    # TODO: Implement optimal (minimax) opponent. Until then every opponent
+    # type gets the random bot.
+    rng = random.Random()
+
+    # Training is pure CPU work. Running it directly here would block the
+    # event loop, so no other request could be answered until it finished.
+    # Instead we hand it to a worker thread and wait for it without blocking.
+    loop = asyncio.get_running_loop()
+    wins, losses, draws = await loop.run_in_executor(
+        None, _run_training, manager, request.num_games, rng
+    )
 
     elapsed = time.time() - start_time
-    new_matchboxes = menace_instance.get_matchbox_count() - initial_matchboxes
-    total_matchboxes = menace_instance.get_matchbox_count()
+    new_matchboxes = menace.get_matchbox_count() - initial_matchboxes
+    total_matchboxes = menace.get_matchbox_count()
     games_per_second = request.num_games / elapsed if elapsed > 0 else 0
 
     # Estimate database size: ~200 bytes per matchbox (state + beads + metadata)
     estimated_db_size_kb = (total_matchboxes * 200) / 1024
 
-    return TrainingResponse(
+    return TrainingResponse.model_construct(
         games_played=request.num_games,
         wins=wins,
         losses=losses,
@@ -509,26 +640,81 @@ async def self_play_training(request: TrainingRequest) -> TrainingResponse:
     )
 
 
+def _run_training(
+    manager: GameManager, num_games: int, rng: random.Random
+) -> Tuple[int, int, int]:
+    """
+    Play training games against a random bot (runs in a worker thread).
+
+    Args:
+        manager: The GameManager (and through it, MENACE) to train
+        num_games: How many games to play
+        rng: Random source for who goes first and for the bot's moves,
+            so a seeded one replays the same opponent
+
+    Returns:
+        Tuple of (wins, losses, draws) from MENACE's perspective
+    """
+    wins = 0
+    losses = 0
+    draws = 0
+
+    # getrandbits(1) is the cheapest coin flip: no [True, False] list to
+    # build and pick from. It runs once per game, hundreds of thousands of
+    # times in a long training run.
+    coin_flip = rng.getrandbits
+    bot_rand = rng.random
+
+    menace = manager.menace
+
+    for _ in range(num_games):
+        # Hold the lock for one game at a time so API requests can
+        # slip in between games
+        with menace_lock:
+            # Play one game against the bot, picking who goes first at
+            # random for variety. Training games skip the Game/GameManager
+            # bookkeeping (see app/core/training.py).
+            moves, result = play_training_game(
+                menace, menace_first=coin_flip(1) == 1, rand=bot_rand
+            )
+
+            # Learn straight away, so the next game is played with the
+            # updated beads
+            menace.learn_from(moves, result)
+
+        # Track results
+        if result == GameResult.WIN:
+            wins += 1
+        elif result == GameResult.LOSS:
+            losses += 1
+        else:
+            draws += 1
+
+    return wins, losses, draws
+
+
+# The estimate endpoint is typically driven by a UI slider, so the same few
+# values come back again and again. A small cache turns those into lookups.
+@lru_cache(maxsize=256)
 def format_time(seconds: float) -> str:
     """Format seconds into a human-readable string."""
     if seconds < 60:
-        return f"{seconds:.1f}s"
+        return "%.1fs" % seconds
     elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}m {secs}s"
+        mins, secs = divmod(int(seconds), 60)
+        return "%dm %ds" % (mins, secs)
     else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        return f"{hours}h {mins}m"
+        hours, rest = divmod(int(seconds), 3600)
+        return "%dh %dm" % (hours, rest // 60)
 
 
+@lru_cache(maxsize=256)
 def format_size(kb: float) -> str:
     """Format KB into a human-readable string."""
     if kb < 1024:
-        return f"{kb:.1f} KB"
+        return "%.1f KB" % kb
     else:
-        return f"{kb / 1024:.2f} MB"
+        return "%.2f MB" % (kb / 1024.0)
 
 
 @router.post(
@@ -562,13 +748,15 @@ def format_size(kb: float) -> str:
 )
 async def estimate_training(
     request: TrainingEstimateRequest,
+    menace: Menace = Depends(get_menace),
 ) -> TrainingEstimateResponse:
     """Estimate training time and storage requirements."""
 
     # Get current state
-    current_matchboxes = menace_instance.get_matchbox_count()
-    stats = menace_instance.get_stats()
-    current_games = stats.get("games_played", 0)
+    with menace_lock:
+        stats = menace.get_statistics()
+    current_matchboxes = stats.matchbox_count
+    current_games = stats.games_played
 
     # Base estimate: ~1400 games per second (measured from 5000 games in 3.5s)
     # This will vary by system, so we use a slightly conservative estimate
@@ -593,7 +781,7 @@ async def estimate_training(
     history_storage = (current_games + request.num_games) * bytes_per_game_history
     total_storage_kb = (matchbox_storage + history_storage) / 1024
 
-    return TrainingEstimateResponse(
+    return TrainingEstimateResponse.model_construct(
         num_games=request.num_games,
         estimated_time_seconds=round(estimated_time, 2),
         estimated_time_formatted=format_time(estimated_time),
@@ -614,10 +802,15 @@ async def estimate_training(
 async def reset_menace():
     """Reset MENACE to initial state."""
 
-    global menace_instance, game_manager
+    # Forget the cached instances - the next request gets fresh ones.
+    # A training run already in progress keeps the instances it was
+    # given and simply finishes on the old MENACE.
+    global _menace_generation
 
-    menace_instance = Menace(player=Player.X)
-    game_manager = GameManager(menace=menace_instance)
+    with menace_lock:
+        get_menace.cache_clear()
+        get_game_manager.cache_clear()
+        _menace_generation += 1
 
     return {
         "message": "MENACE has been reset to initial state",
@@ -631,16 +824,20 @@ async def reset_menace():
 # ============================================================================
 
 
-@router.get(
-    "/health",
-    summary="Health check",
-    description="Check if the API is running.",
-    tags=["System"],
-)
-async def health_check():
+# Health probes hit this endpoint very often, so it skips FastAPI's
+# dependency solving and response validation entirely: it is a plain
+# Starlette endpoint (registered in main.py) that fills two numbers into a
+# pre-built JSON template.
+_HEALTH_TEMPLATE = b'{"status":"healthy","menace_games":%d,"active_games":%d}'
+
+
+async def health_check(request: Request) -> Response:
     """API health check."""
-    return {
-        "status": "healthy",
-        "menace_games": menace_instance.games_played,
-        "active_games": len(game_manager.get_active_games()),
-    }
+    menace = get_menace()
+    manager = get_game_manager(menace)
+
+    return Response(
+        content=_HEALTH_TEMPLATE
+        % (menace.games_played, len(manager.get_active_games())),
+        media_type="application/json",
+    )
@@ -296,9 +296,12 @@ class MatchboxQueryRequest(BaseModel):
     Request to query a matchbox by board state.
     """
 
+    # The pattern is checked by Pydantic's (Rust) core, so a bad state is
+    # rejected with a 422 before our handler ever runs
     board_state: str = Field(
         min_length=9,
         max_length=9,
+        pattern=r"^[XO_]{9}$",
         description="Board state to look up (9 characters: X, O, or _)",
     )
 
@@ -440,6 +443,7 @@ class HistoryResponse(BaseModel):
     history: List[HistorySnapshotResponse] = Field(
         description="List of historical snapshots"
     )
+    total_snapshots: int = Field(description="Total snapshots recorded so far")
     current_games: int = Field(description="Current total games played")
     current_beads: int = Field(description="Current total beads")
 
@@ -466,6 +470,7 @@ class HistoryResponse(BaseModel):
                         "win_rate": 0.4,
                     },
                 ],
+                "total_snapshots": 2,
                 "current_games": 100,
                 "current_beads": 1250,
             }
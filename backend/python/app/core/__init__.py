@@ -6,7 +6,7 @@ Contains the core business logic for the MENACE algorithm.
 
 from app.core.board import Board, Player, GameResult
 from app.core.game import Game
-from app.core.menace import Menace, Matchbox
+from app.core.menace import Menace, Matchbox, MenaceStats, HistoryPoint
 
 __all__ = [
     "Board",
@@ -15,4 +15,6 @@ __all__ = [
     "Game",
     "Menace",
     "Matchbox",
+    "MenaceStats",
+    "HistoryPoint",
 ]
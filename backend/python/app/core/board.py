@@ -9,7 +9,7 @@ This module handles everything related to the game board:
 
 DESIGN DECISIONS:
 
-1. Board Representation: String of 9 characters
+1. Board State: String of 9 characters
    - Each position is 'X', 'O', or '_' (empty)
    - Positions are numbered 0-8:
 
@@ -32,14 +32,37 @@ DESIGN DECISIONS:
    - Simple to serialize for database storage
    - Easy to compare for equality
 
+   Internally, though, a Board keeps two "bitboards" (see below) and only
+   builds the string when someone asks for it.
+
 3. State Normalization:
    - A board can be rotated 4 ways and flipped 2 ways = 8 equivalent states
    - We normalize to the "smallest" string representation
    - This reduces the number of unique states MENACE needs to learn
+
+4. Bitboards:
+   - The board is stored as two 9-bit integers: one for X, one for O
+   - Bit p is set when that player has a piece on position p
+     Example: X on 0, 4 and 8  ->  x = 0b100010001
+   - Making a move is setting one bit, and checking a winning line is one
+     AND: (x & line) == line. No new strings, no character comparisons.
+
+5. Shared Boards:
+   - Boards never change, so each position has exactly one Board object,
+     kept in a pool. Board("X________") twice gives the same object.
+
+6. Interned States:
+   - There are fewer than 20,000 possible 9-character states, so every
+     state string is passed through sys.intern()
+   - Equal states then share one string object, and dictionary lookups
+     (like MENACE's matchboxes) can match keys by identity without
+     comparing characters
 """
 
+import sys
 from enum import Enum
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 
 class Player(Enum):
@@ -55,10 +78,32 @@ class Player(Enum):
     X = "X"
     O = "O"
 
-    @property
-    def other(self) -> "Player":
-        """Return the opposite player."""
-        return Player.O if self == Player.X else Player.X
+    # The opposite player. A plain attribute (set just below the class)
+    # rather than a property, so reading it is as cheap as it gets.
+    other: "Player"
+
+
+Player.X.other = Player.O
+Player.O.other = Player.X
+
+
+# Plain module-level names for the two players.
+#
+# Looking up a member on an Enum class (Player.X) costs several times more
+# than reading an ordinary global, and the board code below does it on
+# every move. These are the very same objects, so callers still get (and
+# can compare against) Player.X and Player.O.
+_X = Player.X
+_O = Player.O
+
+# Where a game stands, as stored in Board._status
+_IN_PROGRESS = 0
+_X_WINS = 1
+_O_WINS = 2
+_DRAW = 3
+
+# The winner for each status above (None: nobody has won)
+_WINNER_BY_STATUS = (None, _X, _O, None)
 
 
 class GameResult(Enum):
@@ -78,6 +123,36 @@ class GameResult(Enum):
     IN_PROGRESS = "in_progress"
 
 
+def _permute_mask(mask: int, transform: Tuple[int, ...]) -> int:
+    """Apply a TRANSFORMATIONS entry to a bitboard (see Board.normalize)."""
+    # Position j of the transformed board holds what was at transform[j]
+    return sum(1 << j for j, source in enumerate(transform) if mask >> source & 1)
+
+
+def _ternary_weight(mask: int) -> int:
+    """Sum of 3^(8 - p) for every position p set in the mask."""
+    return sum(3 ** (8 - p) for p in range(9) if mask >> p & 1)
+
+
+def _first_winning_line_table(winning_masks: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    For each of the 512 masks, the index of the first winning line it fills.
+
+    Masks that contain no complete line map to len(winning_masks).
+    """
+    none = len(winning_masks)
+    return tuple(
+        next((i for i, line in enumerate(winning_masks) if mask & line == line), none)
+        for mask in range(512)
+    )
+
+
+def _row_string(row_bits: int) -> str:
+    """Build one 3-character row from 3 bits of X then 3 bits of O."""
+    x, o = row_bits & 0b111, row_bits >> 3
+    return "".join("X" if x >> k & 1 else "O" if o >> k & 1 else "_" for k in range(3))
+
+
 class Board:
     """
     Represents a Tic-Tac-Toe board and provides game logic.
@@ -110,7 +185,7 @@ class Board:
     ]
 
     # Transformation mappings for normalization
-    # Each list shows where each position goes after the transformation
+    # Each entry shows where each position goes after the transformation
     #
     # Example: ROTATE_90 = [6, 3, 0, 7, 4, 1, 8, 5, 2]
     # means position 0 becomes position 6, position 1 becomes position 3, etc.
@@ -122,44 +197,172 @@ class Board:
     # ---------     ---------
     # 6 | 7 | 8     8 | 5 | 2
 
-    TRANSFORMATIONS = [
-        [0, 1, 2, 3, 4, 5, 6, 7, 8],  # Identity (no change)
-        [6, 3, 0, 7, 4, 1, 8, 5, 2],  # Rotate 90°
-        [8, 7, 6, 5, 4, 3, 2, 1, 0],  # Rotate 180°
-        [2, 5, 8, 1, 4, 7, 0, 3, 6],  # Rotate 270°
-        [2, 1, 0, 5, 4, 3, 8, 7, 6],  # Flip horizontal
-        [6, 7, 8, 3, 4, 5, 0, 1, 2],  # Flip vertical
-        [0, 3, 6, 1, 4, 7, 2, 5, 8],  # Flip diagonal (transpose)
-        [8, 5, 2, 7, 4, 1, 6, 3, 0],  # Flip anti-diagonal
-    ]
+    TRANSFORMATIONS = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8),  # Identity (no change)
+        (6, 3, 0, 7, 4, 1, 8, 5, 2),  # Rotate 90°
+        (8, 7, 6, 5, 4, 3, 2, 1, 0),  # Rotate 180°
+        (2, 5, 8, 1, 4, 7, 0, 3, 6),  # Rotate 270°
+        (2, 1, 0, 5, 4, 3, 8, 7, 6),  # Flip horizontal
+        (6, 7, 8, 3, 4, 5, 0, 1, 2),  # Flip vertical
+        (0, 3, 6, 1, 4, 7, 2, 5, 8),  # Flip diagonal (transpose)
+        (8, 5, 2, 7, 4, 1, 6, 3, 0),  # Flip anti-diagonal
+    )
+
+    # The reverse mapping: INVERSE_TRANSFORMATIONS[i][p] is the index at
+    # which position p appears in TRANSFORMATIONS[i]
+    INVERSE_TRANSFORMATIONS = tuple(
+        tuple(transform.index(position) for position in range(9))
+        for transform in TRANSFORMATIONS
+    )
+
+    # The same lines as bit masks (bit p set for each position p on the line)
+    # Example: the top row (0, 1, 2) becomes 0b000000111
+    WINNING_MASKS = tuple((1 << a) | (1 << b) | (1 << c) for a, b, c in WINNING_LINES)
+
+    # FIRST_WINNING_LINE[mask]: index of the first winning line that a
+    # player with these pieces has completed, or 8 if there is none.
+    # Checking for a winner becomes two table lookups instead of a loop.
+    FIRST_WINNING_LINE = _first_winning_line_table(WINNING_MASKS)
+
+    # All 9 bits set - a board with x | o == FULL has no empty squares
+    FULL = 0b111111111
+
+    # POSITIONS_IN_MASK[mask]: the positions whose bits are set in the mask
+    # Example: POSITIONS_IN_MASK[0b000010001] == (0, 4)
+    POSITIONS_IN_MASK = tuple(
+        tuple(position for position in range(9) if mask >> position & 1)
+        for mask in range(512)
+    )
+
+    # Lookup tables for normalize(), built once when the module is imported.
+    # There are only 512 possible 9-bit masks, so for every transformation we
+    # can simply precompute the answer for each one:
+    #
+    # PERMUTED_MASKS[i][mask]: the mask after applying TRANSFORMATIONS[i]
+    # SYMMETRY_KEYS[i][mask]:  how much that transformed mask "weighs" (below)
+    PERMUTED_MASKS = tuple(
+        tuple(_permute_mask(mask, transform) for mask in range(512))
+        for transform in TRANSFORMATIONS
+    )
+    SYMMETRY_KEYS = tuple(
+        tuple(_ternary_weight(mask) for mask in permuted)
+        for permuted in PERMUTED_MASKS
+    )
+
+    # The 3-character string for each row: index is 3 bits of X | 3 bits of O
+    ROW_STRINGS = tuple(_row_string(row_bits) for row_bits in range(64))
 
     # Empty board constant
     EMPTY = "_________"
 
-    def __init__(self, state: str = EMPTY):
+    # Flyweight pool: one shared Board object per position.
+    #
+    # Boards never change after they are created, and there are fewer than
+    # 20,000 possible positions, so there is no reason to ever build the
+    # same one twice. Self-play creates boards on every move; with the pool
+    # those are dictionary lookups instead of new objects, and equal boards
+    # are the very same object.
+    #
+    # _POOL is keyed by the packed bitboards (x | o << 9), _POOL_BY_STATE by
+    # the state string. Both hold the same Board objects.
+    _POOL: Dict[int, "Board"] = {}
+    _POOL_BY_STATE: Dict[str, "Board"] = {}
+
+    def __new__(cls, state: str = EMPTY) -> "Board":
         """
-        Initialize a board with the given state.
+        Get the board for the given state.
 
         Args:
             state: A 9-character string representing the board.
                    Default is an empty board.
 
+        Returns:
+            The shared Board object for this state
+
         Raises:
             ValueError: If state is invalid
         """
+        # A state we have seen (or built) before is already known to be
+        # valid, so only brand-new strings are parsed and checked below
+        board = cls._POOL_BY_STATE.get(state)
+        if board is not None:
+            return board
+
         # Validate the state
         if len(state) != 9:
             raise ValueError(f"Board state must be 9 characters, got {len(state)}")
 
-        valid_chars = set("XO_")
-        if not all(c in valid_chars for c in state):
-            raise ValueError(f"Board state can only contain 'X', 'O', or '_'")
+        # Build the bitboards (see "Bitboards" above)
+        x = o = 0
+        for position, char in enumerate(state):
+            if char == "X":
+                x |= 1 << position
+            elif char == "O":
+                o |= 1 << position
+            elif char != "_":
+                raise ValueError(f"Board state can only contain 'X', 'O', or '_'")
+
+        board = cls._from_masks(x, o)
+        cls._POOL_BY_STATE[board.state] = board
+        return board
+
+    @classmethod
+    def _from_masks(cls, x: int, o: int) -> "Board":
+        """
+        Get the board with the given bitboards.
 
-        self._state = state
+        Used internally (e.g. by make_move) where the masks are already
+        known to be valid, so there is nothing to parse or check. The state
+        string is only built if someone asks for it.
+        """
+        key = x | (o << 9)
+        board = cls._POOL.get(key)
+        if board is None:
+            board = object.__new__(cls)
+            board._x = x
+            board._o = o
+            board._state = None
+            # Each position is only ever built once (it is pooled), so we can
+            # afford to work out up front everything that never changes:
+            # where the game stands, and (filled in as they are played) the
+            # boards each move leads to
+            board._status = cls._status_of(x, o)
+            board._moves = {}
+            # setdefault: if another thread got here first, use its board
+            board = cls._POOL.setdefault(key, board)
+        return board
+
+    # Copying and pickling must hand back the pooled board, too. By default
+    # they would call Board.__new__() with no arguments - which returns the
+    # shared EMPTY board - and then overwrite its masks with the copied
+    # ones, corrupting the pool for everybody.
+    def __reduce__(self):
+        """Pickle a board as the masks to look it up again by."""
+        return (Board._from_masks, (self._x, self._o))
+
+    def __copy__(self) -> "Board":
+        """Boards are immutable and shared, so a copy is the board itself."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "Board":
+        """Boards are immutable and shared, so a copy is the board itself."""
+        return self
 
     @property
     def state(self) -> str:
         """Get the board state as a string."""
+        if self._state is None:
+            # Glue together the three rows, looked up from ROW_STRINGS
+            x, o = self._x, self._o
+            rows = self.ROW_STRINGS
+            self._state = sys.intern(
+                rows[(x & 7) | (o & 7) << 3]
+                + rows[(x >> 3 & 7) | (o >> 3 & 7) << 3]
+                + rows[(x >> 6) | (o >> 6) << 3]
+            )
+            # Strings we built ourselves are valid by construction, so a
+            # later Board(state) for them can skip parsing and checking
+            self._POOL_BY_STATE.setdefault(self._state, self)
         return self._state
 
     def get_square(self, position: int) -> Optional[Player]:
@@ -172,26 +375,29 @@ class Board:
         Returns:
             Player.X, Player.O, or None if empty
         """
-        char = self._state[position]
-        if char == "X":
-            return Player.X
-        elif char == "O":
-            return Player.O
+        bit = 1 << position
+        if self._x & bit:
+            return _X
+        elif self._o & bit:
+            return _O
         return None
 
-    def get_empty_positions(self) -> List[int]:
+    def get_empty_positions(self) -> Tuple[int, ...]:
         """
         Get all positions that are currently empty.
 
         Returns:
-            List of position indices (0-8) that are empty
+            Tuple of position indices (0-8) that are empty, in order.
+            The tuple is shared (see POSITIONS_IN_MASK), which is fine
+            because tuples can't be modified.
 
         Example:
             >>> board = Board("X_O__X___")
             >>> board.get_empty_positions()
-            [1, 3, 4, 6, 7, 8]
+            (1, 3, 4, 6, 7, 8)
         """
-        return [i for i, char in enumerate(self._state) if char == "_"]
+        # Bits that are set in neither bitboard are the empty squares
+        return self.POSITIONS_IN_MASK[~(self._x | self._o) & self.FULL]
 
     def make_move(self, position: int, player: Player) -> "Board":
         """
@@ -219,12 +425,49 @@ class Board:
         if position < 0 or position > 8:
             raise ValueError(f"Position must be 0-8, got {position}")
 
-        if self._state[position] != "_":
+        # Every move played from this position is remembered, so replaying
+        # it (which self-play and popular openings do constantly) is a
+        # single dictionary lookup. Keys 0-8 are X's moves, 9-17 are O's.
+        key = position if player is _X else position + 9
+        next_board = self._moves.get(key)
+        if next_board is not None:
+            return next_board
+
+        bit = 1 << position
+        if (self._x | self._o) & bit:
             raise ValueError(f"Position {position} is already occupied")
 
-        # Create new state with the move
-        new_state = self._state[:position] + player.value + self._state[position + 1 :]
-        return Board(new_state)
+        # Create new board with the player's bit set
+        if player is _X:
+            next_board = Board._from_masks(self._x | bit, self._o)
+        else:
+            next_board = Board._from_masks(self._x, self._o | bit)
+        self._moves[key] = next_board
+        return next_board
+
+    @classmethod
+    def _status_of(cls, x: int, o: int) -> int:
+        """
+        Work out where the game stands, all in one go.
+
+        This runs once per position (see _from_masks) and is stored as
+        board._status, which check_winner, is_draw, is_game_over and
+        get_result all read.
+
+        Returns:
+            _IN_PROGRESS, _X_WINS, _O_WINS or _DRAW
+        """
+        # Whoever completed the earlier line wins (only matters for boards
+        # that could never happen in a real game, where both have a line)
+        x_line = cls.FIRST_WINNING_LINE[x]
+        o_line = cls.FIRST_WINNING_LINE[o]
+        if x_line < o_line:
+            return _X_WINS
+        if o_line < x_line:
+            return _O_WINS
+        if (x | o) == cls.FULL:
+            return _DRAW
+        return _IN_PROGRESS
 
     def check_winner(self) -> Optional[Player]:
         """
@@ -233,14 +476,7 @@ class Board:
         Returns:
             Player.X or Player.O if there's a winner, None otherwise
         """
-        for line in self.WINNING_LINES:
-            a, b, c = line
-            if (
-                self._state[a] != "_"
-                and self._state[a] == self._state[b] == self._state[c]
-            ):
-                return Player(self._state[a])
-        return None
+        return _WINNER_BY_STATUS[self._status]
 
     def is_draw(self) -> bool:
         """
@@ -251,11 +487,11 @@ class Board:
         Returns:
             True if it's a draw, False otherwise
         """
-        return "_" not in self._state and self.check_winner() is None
+        return self._status == _DRAW
 
     def is_game_over(self) -> bool:
         """Check if the game has ended (win or draw)."""
-        return self.check_winner() is not None or self.is_draw()
+        return self._status != _IN_PROGRESS
 
     def get_result(self, menace_player: Player) -> GameResult:
         """
@@ -267,14 +503,16 @@ class Board:
         Returns:
             GameResult indicating win/loss/draw/in_progress
         """
-        winner = self.check_winner()
+        status = self._status
 
-        if winner is not None:
-            return GameResult.WIN if winner == menace_player else GameResult.LOSS
-        elif self.is_draw():
+        if status == _IN_PROGRESS:
+            return GameResult.IN_PROGRESS
+        elif status == _DRAW:
             return GameResult.DRAW
+        elif _WINNER_BY_STATUS[status] is menace_player:
+            return GameResult.WIN
         else:
-            return GameResult.IN_PROGRESS
+            return GameResult.LOSS
 
     def normalize(self) -> Tuple[str, int]:
         """
@@ -291,19 +529,9 @@ class Board:
             A tuple of (normalized_state, transformation_index)
             The transformation_index can be used to map moves back
         """
-        # Generate all 8 transformations and pick the "smallest" one
-        # "Smallest" means the one that comes first alphabetically
-        transformations = []
-
-        for i, transform in enumerate(self.TRANSFORMATIONS):
-            # Apply the transformation
-            transformed = "".join(self._state[pos] for pos in transform)
-            transformations.append((transformed, i))
-
-        # Sort to find the canonical (smallest) form
-        transformations.sort(key=lambda x: x[0])
-
-        return transformations[0]
+        # Equivalent work is shared between all boards with the same pieces
+        # (see _normalize_masks below)
+        return _normalize_masks(self._x | (self._o << 9))
 
     def transform_position(self, position: int, transform_idx: int) -> int:
         """
@@ -320,9 +548,9 @@ class Board:
         Returns:
             The transformed position
         """
-        transform = self.TRANSFORMATIONS[transform_idx]
-        # Find where this position ends up in the transformation
-        return transform.index(position)
+        # Where this position ends up (a table lookup instead of searching
+        # the transformation with list.index)
+        return self.INVERSE_TRANSFORMATIONS[transform_idx][position]
 
     def inverse_transform_position(self, position: int, transform_idx: int) -> int:
         """
@@ -338,27 +566,65 @@ class Board:
         Returns:
             The position on the original board
         """
-        transform = self.TRANSFORMATIONS[transform_idx]
-        return transform[position]
+        return self.TRANSFORMATIONS[transform_idx][position]
 
     def __str__(self) -> str:
         """Pretty-print the board for debugging."""
         rows = []
         for i in range(0, 9, 3):
-            row = " | ".join(self._state[i : i + 3])
+            row = " | ".join(self.state[i : i + 3])
             rows.append(row)
         return "\n---------\n".join(rows)
 
     def __repr__(self) -> str:
         """Programmer-friendly representation."""
-        return f"Board('{self._state}')"
+        return f"Board('{self.state}')"
 
     def __eq__(self, other: object) -> bool:
         """Check equality based on state."""
+        # Pooled boards are shared, so equal boards are usually the same object
+        if self is other:
+            return True
         if not isinstance(other, Board):
             return False
-        return self._state == other._state
+        return self._x == other._x and self._o == other._o
 
     def __hash__(self) -> int:
         """Allow boards to be used as dictionary keys."""
-        return hash(self._state)
+        # The two 9-bit masks side by side are unique per state
+        return self._x | (self._o << 9)
+
+
+# Normalizing is a pure function of the pieces on the board, and there are
+# only 5,478 reachable positions, so every answer is cached: after a short
+# warm-up, each call is a single dictionary lookup. The key packs both
+# bitboards into one int (x in the low 9 bits, o above them) because one
+# int hashes faster than a tuple of two.
+@lru_cache(maxsize=8192)
+def _normalize_masks(packed: int) -> Tuple[str, int]:
+    """Board.normalize() for the board with the given packed bitboards."""
+    # The canonical form is the transformed state that comes first
+    # alphabetically ('O' < 'X' < '_'). Rather than building and sorting
+    # 8 strings, we compare them as numbers.
+    #
+    # Read a state as a base-3 number, one digit per position (position 0
+    # is the most significant) with O=0, X=1, _=2. Alphabetical order is
+    # then numeric order, and the number works out to
+    #
+    #     2 * (3^9 - 1) - weight(x) - 2 * weight(o)
+    #
+    # where weight() is SYMMETRY_KEYS. So the smallest state is the one
+    # with the LARGEST weight(x) + 2 * weight(o).
+    x, o = packed & Board.FULL, packed >> 9
+    best_score = -1
+    best_idx = 0
+    for i, keys in enumerate(Board.SYMMETRY_KEYS):
+        score = keys[x] + 2 * keys[o]
+        # Strictly greater: on a tie the first transformation wins,
+        # just as it did with a (stable) sort
+        if score > best_score:
+            best_score = score
+            best_idx = i
+
+    permuted = Board.PERMUTED_MASKS[best_idx]
+    return Board._from_masks(permuted[x], permuted[o]).state, best_idx
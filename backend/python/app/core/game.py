@@ -21,18 +21,34 @@ DESIGN DECISIONS:
 3. Player Roles:
    - MENACE is always one player (X or O)
    - The opponent can be a human or a bot
+
+4. Games Are Not Recycled:
+   - Only API games create Game objects (self-play training uses the
+     lighter loop in training.py), so there are only a few per second
+   - A finished game can still be read through the API after it leaves
+     the active set, and a request may be holding on to it. Reusing the
+     object for a new game could change it under that reader, so each
+     game gets a fresh object
 """
 
-from typing import List, Optional, Tuple
+from collections import OrderedDict
+from typing import List, Optional, Tuple, ValuesView
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+import sys
+import time
 import uuid
 
 from app.core.board import Board, Player, GameResult
 from app.core.menace import Menace
 
 
+# dataclass(slots=True) is new in Python 3.10; on 3.9 moves simply keep
+# their regular __dict__ (same as app/db/models.py)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class GameState(Enum):
     """The current state of a game session."""
 
@@ -49,22 +65,28 @@ class OpponentType(Enum):
     OPTIMAL_BOT = "optimal_bot"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Move:
     """
     Records a single move in the game.
 
+    One of these is created for every move, so it is kept small:
+    - slots=True stores the four fields directly instead of in a
+      per-object dict, which makes each Move smaller and faster to create
+    - The timestamp is a plain time.time() number; building a datetime
+      is much slower and is only needed when the move is serialized
+
     Attributes:
         player: Who made the move (X or O)
         position: Where they moved (0-8)
         board_after: The board state after the move
-        timestamp: When the move was made
+        timestamp: When the move was made (seconds since the epoch)
     """
 
     player: Player
     position: int
     board_after: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)
 
     def to_dict(self) -> dict:
         """Convert to dictionary for serialization."""
@@ -72,10 +94,37 @@ class Move:
             "player": self.player.value,
             "position": self.position,
             "board_after": self.board_after,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
         }
 
 
+@dataclass(frozen=True)
+class GameView:
+    """
+    A read-only summary of a game at one point in time.
+
+    API handlers need the same handful of facts (is it over? who won?
+    which moves are left?) several times per request. Computing them once
+    and keeping the result until the next move avoids re-scanning the
+    board for every question.
+
+    Attributes:
+        board: The board state string the view was taken from
+        state: The current GameState
+        is_over: Whether the game has ended
+        valid_moves: Empty positions (empty tuple once the game is over)
+        winner: The winning player, or None
+        result: Result from MENACE's perspective (None until the game ends)
+    """
+
+    board: str
+    state: GameState
+    is_over: bool
+    valid_moves: Tuple[int, ...]
+    winner: Optional[Player]
+    result: Optional[GameResult]
+
+
 @dataclass
 class Game:
     """
@@ -109,6 +158,8 @@ class Game:
             menace.learn(result)
     """
 
+    # A random UUID rather than a counter: the ID is all a client needs to
+    # play moves in a game, so it must not be guessable from other games' IDs
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     board: Board = field(default_factory=Board)
     menace: Menace = None
@@ -118,6 +169,10 @@ class Game:
     result: Optional[GameResult] = None
     opponent_type: OpponentType = OpponentType.HUMAN
     created_at: datetime = field(default_factory=datetime.now)
+    # Cached GameView - cleared whenever a move is played
+    _view_cache: Optional[GameView] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize after dataclass creation."""
@@ -159,6 +214,39 @@ class Game:
         """
         return self.board.get_result(self.menace_player)
 
+    def snapshot(self) -> GameView:
+        """
+        Get a cached summary of the current game state.
+
+        The board is only scanned the first time this is called after a
+        move; later calls return the same GameView object.
+
+        Returns:
+            The GameView for the current board
+        """
+        if self._view_cache is None:
+            winner = self.board.check_winner()
+            is_over = winner is not None or self.board.is_draw()
+
+            if is_over:
+                state = GameState.FINISHED
+            elif self.current_turn == self.menace_player:
+                state = GameState.WAITING_FOR_MENACE
+            else:
+                state = GameState.WAITING_FOR_OPPONENT
+
+            self._view_cache = GameView(
+                board=self.board.state,
+                state=state,
+                is_over=is_over,
+                valid_moves=(
+                    () if is_over else self.board.get_empty_positions()
+                ),
+                winner=winner,
+                result=self.board.get_result(self.menace_player) if is_over else None,
+            )
+        return self._view_cache
+
     def menace_move(self) -> Tuple[int, Board]:
         """
         Let MENACE make its move.
@@ -195,6 +283,7 @@ class Game:
 
         # Switch turns
         self.current_turn = self.current_turn.other
+        self._view_cache = None
 
         # Update result if game ended
         if self.is_over():
@@ -241,6 +330,7 @@ class Game:
 
         # Switch turns
         self.current_turn = self.current_turn.other
+        self._view_cache = None
 
         # Update result if game ended
         if self.is_over():
@@ -248,10 +338,10 @@ class Game:
 
         return self.board
 
-    def get_valid_moves(self) -> List[int]:
-        """Get list of valid moves for the current player."""
+    def get_valid_moves(self) -> Tuple[int, ...]:
+        """Get the valid moves for the current player."""
         if self.is_over():
-            return []
+            return ()
         return self.board.get_empty_positions()
 
     def to_dict(self) -> dict:
@@ -276,8 +366,20 @@ class GameManager:
 
     This class keeps track of active games and provides methods
     to create and retrieve games.
+
+    Games are kept in two bounded containers so a long-running server
+    (or a big training run) can't fill up memory:
+    - active: games still being played, oldest evicted past MAX_ACTIVE_GAMES
+    - finished: the most recently finished games, so clients can still
+      fetch the final state, oldest dropped past MAX_FINISHED_GAMES
+
+    Both are OrderedDicts: lookups by ID are O(1), and the insertion
+    order tells us which game is the oldest.
     """
 
+    MAX_ACTIVE_GAMES = 1024
+    MAX_FINISHED_GAMES = 1024
+
     def __init__(self, menace: Menace):
         """
         Initialize the game manager.
@@ -286,8 +388,8 @@ class GameManager:
             menace: The MENACE instance to use for all games
         """
         self.menace = menace
-        self.games: dict[str, Game] = {}
-        self.completed_games: List[str] = []
+        self.active: OrderedDict[str, Game] = OrderedDict()
+        self.finished: OrderedDict[str, Game] = OrderedDict()
 
     def create_game(
         self,
@@ -319,12 +421,22 @@ class GameManager:
             opponent_type=opponent_type,
         )
 
-        self.games[game.id] = game
+        self.active[game.id] = game
+
+        # Drop the least recently used game if there are too many
+        if len(self.active) > self.MAX_ACTIVE_GAMES:
+            self.active.popitem(last=False)
+
         return game
 
     def get_game(self, game_id: str) -> Optional[Game]:
-        """Get a game by ID."""
-        return self.games.get(game_id)
+        """Get a game by ID (active or recently finished)."""
+        game = self.active.get(game_id)
+        if game is not None:
+            # Mark as recently used so it isn't the next one evicted
+            self.active.move_to_end(game_id)
+            return game
+        return self.finished.get(game_id)
 
     def finish_game(self, game_id: str):
         """
@@ -333,14 +445,19 @@ class GameManager:
         Args:
             game_id: The ID of the game to finish
         """
-        game = self.get_game(game_id)
+        game = self.active.get(game_id)
         if game and game.is_over():
             # Apply learning
             self.menace.learn(game.get_result())
+            self._retire(game)
 
-            # Track completion
-            self.completed_games.append(game_id)
+    def _retire(self, game: Game):
+        """Move a game from the active games to the finished ones."""
+        del self.active[game.id]
+        self.finished[game.id] = game
+        if len(self.finished) > self.MAX_FINISHED_GAMES:
+            self.finished.popitem(last=False)
 
-    def get_active_games(self) -> List[Game]:
+    def get_active_games(self) -> ValuesView[Game]:
         """Get all active (not finished) games."""
-        return [g for g in self.games.values() if not g.is_over()]
+        return self.active.values()
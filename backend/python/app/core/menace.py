@@ -42,7 +42,8 @@ DESIGN DECISIONS:
 """
 
 import random
-from typing import Dict, List, Optional, Tuple
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass, field
 
 from app.core.board import Board, Player, GameResult
@@ -59,6 +60,8 @@ class Matchbox:
     Attributes:
         board_state: The normalized board state this matchbox is for
         beads: Dictionary mapping position (0-8) to bead count
+            (change it through add_beads/remove_beads so the cached
+            total stays right)
         times_used: How many times this matchbox has been accessed
 
     Example:
@@ -73,14 +76,30 @@ class Matchbox:
     board_state: str
     beads: Dict[int, int] = field(default_factory=dict)
     times_used: int = 0
-
-    def draw_bead(self) -> int:
+    # Cached "favorite" move - recomputed lazily after beads change
+    _top_move: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _top_move_stale: bool = field(default=True, init=False, repr=False, compare=False)
+    # Cached get_probabilities() result - None until computed or after a change
+    _probabilities: Optional[Dict[int, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Running bead total - kept up to date by add_beads/remove_beads
+    _total: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._total = sum(self.beads.values())
+
+    def draw_bead(self, rand: Callable[[], float] = random.random) -> int:
         """
         Draw a random bead (weighted by count).
 
         This simulates reaching into the matchbox and pulling out a bead.
         Positions with more beads are more likely to be chosen.
 
+        Args:
+            rand: Source of random numbers in [0, 1) - MENACE passes its
+                own generator (see Menace.__init__)
+
         Returns:
             The position (0-8) corresponding to the drawn bead
 
@@ -93,27 +112,65 @@ class Matchbox:
         if not self.beads:
             raise ValueError("Matchbox is empty - no moves available!")
 
-        # Create a weighted list
-        # e.g., {0: 2, 4: 3} becomes [0, 0, 4, 4, 4]
-        weighted_positions = []
+        # Pick the n-th bead without laying all the beads out in a list:
+        # e.g. with {0: 2, 4: 3}, beads 0-1 belong to position 0 and beads
+        # 2-4 to position 4. Walking the (at most 9) positions and
+        # subtracting their counts finds the owner of bead n.
+        n = int(rand() * self._total)
         for position, count in self.beads.items():
-            weighted_positions.extend([position] * count)
+            n -= count
+            if n < 0:
+                return position
 
-        # Random choice from weighted list
-        return random.choice(weighted_positions)
+        # Only reachable if every count is 0 (can't happen with min_beads=1)
+        return position
 
-    def add_beads(self, position: int, count: int = 1):
+    def apply_delta(
+        self, position: int, delta: int, min_beads: Optional[int] = 1
+    ) -> int:
+        """
+        Add (positive delta) or remove (negative delta) beads at a position.
+
+        This is the single update path behind add_beads/remove_beads, and
+        what learning calls directly with the signed reward for the game.
+
+        Args:
+            position: The move position to change
+            delta: How many beads to add (negative to remove)
+            min_beads: Minimum beads to keep (prevents removing move
+                entirely), or None for no minimum
+
+        Returns:
+            The actual change in bead count - smaller than delta when
+            min_beads stops a removal, 0 for an unknown position
+        """
+        old = self.beads.get(position)
+        if old is None:
+            return 0
+        new = old + delta
+        if min_beads is not None and new < min_beads:
+            new = min_beads
+        self.beads[position] = new
+        self._total += new - old
+        self._top_move_stale = True
+        self._probabilities = None
+        return new - old
+
+    def add_beads(self, position: int, count: int = 1) -> int:
         """
         Add beads to a position (reward).
 
         Args:
             position: The move position to reward
             count: How many beads to add
+
+        Returns:
+            How many beads were added - always count, since nothing is
+            clamped here (0 for an unknown position)
         """
-        if position in self.beads:
-            self.beads[position] += count
+        return self.apply_delta(position, count, min_beads=None)
 
-    def remove_beads(self, position: int, count: int = 1, min_beads: int = 1):
+    def remove_beads(self, position: int, count: int = 1, min_beads: int = 1) -> int:
         """
         Remove beads from a position (punishment).
 
@@ -121,25 +178,50 @@ class Matchbox:
             position: The move position to punish
             count: How many beads to remove
             min_beads: Minimum beads to keep (prevents removing move entirely)
+
+        Returns:
+            The change in bead count (0 or negative - fewer than count
+            when min_beads stops it)
         """
-        if position in self.beads:
-            self.beads[position] = max(min_beads, self.beads[position] - count)
+        return self.apply_delta(position, -count, min_beads)
 
     def get_total_beads(self) -> int:
         """Get the total number of beads in this matchbox."""
-        return sum(self.beads.values())
+        return self._total
+
+    @property
+    def top_move(self) -> Optional[int]:
+        """
+        The position with the most beads (MENACE's "favorite" move).
+
+        Only recomputed after add_beads/remove_beads has changed the beads.
+        Returns None if the matchbox is empty.
+        """
+        if self._top_move_stale:
+            self._top_move = (
+                max(self.beads, key=self.beads.__getitem__) if self.beads else None
+            )
+            self._top_move_stale = False
+        return self._top_move
 
     def get_probabilities(self) -> Dict[int, float]:
         """
         Get the probability of each move.
 
+        Like top_move, the result is cached until the beads change, so the
+        returned dictionary is shared - don't modify it.
+
         Returns:
             Dictionary mapping position to probability (0.0 to 1.0)
         """
-        total = self.get_total_beads()
-        if total == 0:
-            return {}
-        return {pos: count / total for pos, count in self.beads.items()}
+        if self._probabilities is None:
+            total = self.get_total_beads()
+            if total == 0:
+                return {}
+            self._probabilities = {
+                pos: count / total for pos, count in self.beads.items()
+            }
+        return self._probabilities
 
     def to_dict(self) -> dict:
         """Convert to a dictionary for JSON serialization."""
@@ -153,23 +235,80 @@ class Matchbox:
     def from_dict(cls, data: dict) -> "Matchbox":
         """Create a Matchbox from a dictionary."""
         return cls(
-            board_state=data["board_state"],
+            # Interned like every other board state (see board.py)
+            board_state=sys.intern(data["board_state"]),
             beads={int(k): v for k, v in data["beads"].items()},
             times_used=data.get("times_used", 0),
         )
 
 
-@dataclass
 class MoveRecord:
     """
     Records a single move made during a game.
 
     Used to track MENACE's moves so we can apply learning after the game.
+    One is created for every move MENACE makes (millions during training),
+    so like game.Move it uses __slots__: the three fields are stored
+    directly instead of in a per-object dict, which makes each record
+    less than half the size and faster to create.
+    """
+
+    __slots__ = ("board_state", "position", "transform_idx")
+
+    def __init__(self, board_state: str, position: int, transform_idx: int):
+        self.board_state = board_state  # The normalized board state
+        self.position = position  # The position chosen (on normalized board)
+        self.transform_idx = transform_idx  # The transformation used to normalize
+
+    def __repr__(self) -> str:
+        return (
+            f"MoveRecord(board_state={self.board_state!r}, "
+            f"position={self.position}, transform_idx={self.transform_idx})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MoveRecord):
+            return NotImplemented
+        return (
+            self.board_state == other.board_state
+            and self.position == other.position
+            and self.transform_idx == other.transform_idx
+        )
+
+
+class MenaceStats(NamedTuple):
+    """
+    A snapshot of MENACE's learning statistics.
+
+    A NamedTuple is a tuple with named fields: it is immutable (so one
+    snapshot can safely be shared between callers) and smaller and cheaper
+    to create than a dict. Use ._asdict() when a dict is needed.
+    """
+
+    games_played: int
+    wins: int
+    losses: int
+    draws: int
+    win_rate: float
+    matchbox_count: int
+    total_beads: int
+
+
+class HistoryPoint(NamedTuple):
     """
+    One point on MENACE's learning curve.
 
-    board_state: str  # The normalized board state
-    position: int  # The position chosen (on normalized board)
-    transform_idx: int  # The transformation used to normalize
+    Stored as a tuple rather than a dict because training can record
+    thousands of these, and a tuple takes about half the memory.
+    """
+
+    games: int
+    total_beads: int
+    matchbox_count: int
+    wins: int
+    losses: int
+    draws: int
+    win_rate: float
 
 
 class Menace:
@@ -211,6 +350,7 @@ class Menace:
         win_reward: int = DEFAULT_WIN_REWARD,
         draw_reward: int = DEFAULT_DRAW_REWARD,
         loss_penalty: int = DEFAULT_LOSS_PENALTY,
+        seed: Optional[int] = None,
     ):
         """
         Initialize MENACE.
@@ -221,6 +361,8 @@ class Menace:
             win_reward: Beads to add on win
             draw_reward: Beads to add on draw
             loss_penalty: Beads to remove on loss
+            seed: Seed for MENACE's bead draws (None for an unpredictable
+                one) - the same seed and opponent give the same games
         """
         self.player = player
         self.matchboxes: Dict[str, Matchbox] = {}
@@ -232,15 +374,35 @@ class Menace:
         self.draw_reward = draw_reward
         self.loss_penalty = loss_penalty
 
+        # MENACE's own random number generator for drawing beads. Having
+        # one per MENACE makes its choices reproducible with a seed, and
+        # keeping the bound random() method saves a lookup on every move.
+        self._rng = random.Random(seed)
+        self._random = self._rng.random
+
         # Statistics
         self.games_played = 0
         self.wins = 0
         self.losses = 0
         self.draws = 0
 
-        # History tracking for graphs
-        # Each entry: {games: int, total_beads: int, matchbox_count: int, wins: int, losses: int, draws: int}
-        self.history: List[dict] = []
+        # History tracking for graphs (one HistoryPoint per snapshot)
+        self.history: List[HistoryPoint] = []
+        # games_played value at which the next snapshot is due
+        self._next_snapshot = self._snapshot_after(self.games_played)
+
+        # Beads across all matchboxes. Every history snapshot needs this,
+        # so it is kept as a running total instead of summing hundreds of
+        # matchboxes after every game.
+        self._total_beads = 0
+
+        # Bumped on every change to the matchboxes, so readers (like the
+        # API's matchbox list) can tell whether a cached copy is still valid
+        self._version = 0
+
+        # Last statistics snapshot and the version it was taken at
+        self._stats_cache: Optional[MenaceStats] = None
+        self._stats_version = -1
 
     def _get_or_create_matchbox(self, normalized_state: str, board: Board) -> Matchbox:
         """
@@ -256,7 +418,8 @@ class Menace:
         Returns:
             The Matchbox for this state
         """
-        if normalized_state not in self.matchboxes:
+        matchbox = self.matchboxes.get(normalized_state)
+        if matchbox is None:
             # Create new matchbox with initial beads
             # We need to find empty positions on the normalized board
             normalized_board = Board(normalized_state)
@@ -265,11 +428,11 @@ class Menace:
             # Initialize beads for each empty position
             beads = {pos: self.initial_beads for pos in empty_positions}
 
-            self.matchboxes[normalized_state] = Matchbox(
-                board_state=normalized_state, beads=beads
-            )
+            matchbox = Matchbox(board_state=normalized_state, beads=beads)
+            self.matchboxes[normalized_state] = matchbox
+            self._total_beads += matchbox.get_total_beads()
 
-        return self.matchboxes[normalized_state]
+        return matchbox
 
     def get_move(self, board: Board) -> int:
         """
@@ -294,9 +457,10 @@ class Menace:
         # Step 2: Get the matchbox
         matchbox = self._get_or_create_matchbox(normalized_state, board)
         matchbox.times_used += 1
+        self._version += 1
 
         # Step 3: Draw a bead (choose a move)
-        normalized_position = matchbox.draw_bead()
+        normalized_position = matchbox.draw_bead(self._random)
 
         # Step 4: Record the move for learning
         self.move_history.append(
@@ -325,8 +489,28 @@ class Menace:
         Args:
             result: The game result (WIN, LOSS, or DRAW)
         """
+        if self.learn_from(self.move_history, result):
+            # Clear move history for next game
+            self.move_history = []
+
+    def learn_from(self, moves: List[MoveRecord], result: GameResult) -> bool:
+        """
+        Apply one game's result to the matchboxes used in that game.
+
+        Like learn(), but for moves that were handed back instead of being
+        kept in move_history - self-play training (see training.py) calls
+        this right after each game it plays.
+
+        Args:
+            moves: The MoveRecords MENACE made during the game
+            result: The game result (WIN, LOSS, or DRAW)
+
+        Returns:
+            True if learning was applied, False if the game wasn't over
+        """
         # Update statistics
         self.games_played += 1
+        self._version += 1
 
         if result == GameResult.WIN:
             self.wins += 1
@@ -339,22 +523,22 @@ class Menace:
             reward = -self.loss_penalty
         else:
             # Game still in progress - don't learn
-            return
-
-        # Apply learning to each move made
-        for move in self.move_history:
-            matchbox = self.matchboxes[move.board_state]
-
-            if reward > 0:
-                matchbox.add_beads(move.position, reward)
-            else:
-                matchbox.remove_beads(move.position, abs(reward), self.MIN_BEADS)
-
-        # Clear move history for next game
-        self.move_history = []
+            return False
+
+        # Apply learning to each move made. reward is already signed, so
+        # wins, draws and losses all go through the same update.
+        matchboxes = self.matchboxes
+        min_beads = self.MIN_BEADS
+        change = 0
+        for move in moves:
+            change += matchboxes[move.board_state].apply_delta(
+                move.position, reward, min_beads
+            )
+        self._total_beads += change
 
         # Record snapshot for history graph
         self._record_history_snapshot()
+        return True
 
     def _record_history_snapshot(self):
         """
@@ -363,53 +547,83 @@ class Menace:
         This is called after each game to track MENACE's learning
         progress over time, enabling visualization of bead growth.
         """
-        # Only record every N games to keep history manageable
-        # Record every game for first 100, then every 10, then every 100
-        if self.games_played <= 100:
-            record = True
-        elif self.games_played <= 1000:
-            record = self.games_played % 10 == 0
-        else:
-            record = self.games_played % 100 == 0
-
-        if record:
-            self.history.append(
-                {
-                    "games": self.games_played,
-                    "total_beads": self.get_total_beads(),
-                    "matchbox_count": self.get_matchbox_count(),
-                    "wins": self.wins,
-                    "losses": self.losses,
-                    "draws": self.draws,
-                    "win_rate": self.wins / max(1, self.games_played),
-                }
+        # Most games don't need a snapshot, so the schedule is worked out
+        # once per snapshot (see _snapshot_after) rather than every game
+        if self.games_played < self._next_snapshot:
+            return
+        self._next_snapshot = self._snapshot_after(self.games_played)
+
+        self.history.append(
+            HistoryPoint(
+                games=self.games_played,
+                total_beads=self.get_total_beads(),
+                matchbox_count=self.get_matchbox_count(),
+                wins=self.wins,
+                losses=self.losses,
+                draws=self.draws,
+                win_rate=self.wins / max(1, self.games_played),
             )
+        )
+
+    @staticmethod
+    def _snapshot_after(games: int) -> int:
+        """
+        Return the games_played count at which the next snapshot is due.
+
+        Only every Nth game is recorded to keep history manageable:
+        every game for the first 100, then every 10th up to 1000, then
+        every 100th.
+
+        Args:
+            games: Games played so far
+
+        Returns:
+            The first games_played value after games that gets a snapshot
+        """
+        if games < 100:
+            return games + 1
+        if games < 1000:
+            return (games // 10 + 1) * 10
+        return (games // 100 + 1) * 100
 
     def reset_game(self):
         """Reset for a new game (clear move history)."""
         self.move_history = []
 
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever any matchbox changes."""
+        return self._version
+
     def get_matchbox_count(self) -> int:
         """Get the number of matchboxes MENACE has created."""
         return len(self.matchboxes)
 
     def get_total_beads(self) -> int:
         """Get the total beads across all matchboxes."""
-        return sum(mb.get_total_beads() for mb in self.matchboxes.values())
+        return self._total_beads
 
-    def get_statistics(self) -> dict:
-        """Get MENACE's learning statistics."""
-        return {
-            "games_played": self.games_played,
-            "wins": self.wins,
-            "losses": self.losses,
-            "draws": self.draws,
-            "win_rate": self.wins / max(1, self.games_played),
-            "matchbox_count": self.get_matchbox_count(),
-            "total_beads": self.get_total_beads(),
-        }
+    def get_statistics(self) -> MenaceStats:
+        """
+        Get MENACE's learning statistics.
 
-    def get_history(self) -> List[dict]:
+        The snapshot is cached and only rebuilt after MENACE has changed
+        (see version), so repeated calls between games are free.
+        """
+        if self._stats_version != self._version or self._stats_cache is None:
+            self._stats_cache = MenaceStats(
+                games_played=self.games_played,
+                wins=self.wins,
+                losses=self.losses,
+                draws=self.draws,
+                win_rate=self.wins / max(1, self.games_played),
+                matchbox_count=self.get_matchbox_count(),
+                total_beads=self.get_total_beads(),
+            )
+            self._stats_version = self._version
+        return self._stats_cache
+
+    def get_history(self, since: int = 0, limit: Optional[int] = None) -> List[dict]:
         """
         Get the history of MENACE's learning progress.
 
@@ -421,10 +635,19 @@ class Menace:
         - win_rate: Win percentage at that point
 
         Used for graphing bead growth over time.
+
+        Args:
+            since: Index of the first snapshot to return
+            limit: Maximum number of snapshots (None means all the rest)
+
+        Returns:
+            The requested snapshots as dictionaries
         """
-        return self.history.copy()
+        end = None if limit is None else since + limit
+        # Only the requested slice is turned into dicts
+        return [point._asdict() for point in self.history[since:end]]
 
-    def get_matchbox_data(self, board_state: str) -> Optional[dict]:
+    def get_matchbox_data(self, board_state: str) -> Optional[Tuple[Matchbox, dict]]:
         """
         Get data about a specific matchbox.
 
@@ -432,15 +655,18 @@ class Menace:
             board_state: The board state to look up
 
         Returns:
-            Matchbox data or None if not found
+            Tuple of (matchbox, matchbox data), or None if not found.
+            The matchbox itself is included so callers can ask it for more
+            (like probabilities) without looking it up again.
         """
         # Normalize the state first
         board = Board(board_state)
         normalized_state, _ = board.normalize()
 
-        if normalized_state in self.matchboxes:
-            return self.matchboxes[normalized_state].to_dict()
-        return None
+        matchbox = self.matchboxes.get(normalized_state)
+        if matchbox is None:
+            return None
+        return matchbox, matchbox.to_dict()
 
     def to_dict(self) -> dict:
         """Serialize MENACE's state for persistence."""
@@ -457,7 +683,7 @@ class Menace:
             "win_reward": self.win_reward,
             "draw_reward": self.draw_reward,
             "loss_penalty": self.loss_penalty,
-            "history": self.history,
+            "history": [point._asdict() for point in self.history],
         }
 
     @classmethod
@@ -475,12 +701,17 @@ class Menace:
         menace.wins = data.get("wins", 0)
         menace.losses = data.get("losses", 0)
         menace.draws = data.get("draws", 0)
+        menace._next_snapshot = menace._snapshot_after(menace.games_played)
+
+        menace.matchboxes = {}
+        for mb_data in data.get("matchboxes", {}).values():
+            matchbox = Matchbox.from_dict(mb_data)
+            # Key by the matchbox's own (interned) state string
+            menace.matchboxes[matchbox.board_state] = matchbox
+        menace._total_beads = sum(
+            mb.get_total_beads() for mb in menace.matchboxes.values()
+        )
 
-        menace.matchboxes = {
-            state: Matchbox.from_dict(mb_data)
-            for state, mb_data in data.get("matchboxes", {}).items()
-        }
-
-        menace.history = data.get("history", [])
+        menace.history = [HistoryPoint(**point) for point in data.get("history", [])]
 
         return menace
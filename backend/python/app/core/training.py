@@ -0,0 +1,75 @@
+"""
+Training Module - Fast Self-Play Games
+
+Self-play training plays tens of thousands of games in a row, and nobody
+ever looks at those games: all that matters is which moves MENACE made
+and how each game ended.
+
+Playing them through Game objects (like the API does for human games)
+means a Game, a Move record, a timestamp and turn bookkeeping for every
+single move. This module plays a whole game in one tight loop instead,
+where the only state is the current Board:
+
+- Boards are shared, one per position (see board.py), so a game is just
+  a walk from one existing Board to the next
+- Each Board remembers the boards its moves lead to, its empty squares
+  and whether the game is over, so every step is a few lookups
+
+MENACE itself is used exactly as in a normal game (get_move records the
+moves it makes), so learning from these games works the same way.
+"""
+
+import random
+from typing import Callable, List, Tuple
+
+from app.core.board import Board, GameResult, Player
+from app.core.menace import Menace, MoveRecord
+
+
+def play_training_game(
+    menace: Menace,
+    menace_first: bool,
+    rand: Callable[[], float] = random.random,
+) -> Tuple[List[MoveRecord], GameResult]:
+    """
+    Play one complete game between MENACE and a random bot.
+
+    MENACE does NOT learn from the game here - the caller decides when to
+    apply learning (see Menace.learn_from).
+
+    Args:
+        menace: The MENACE player
+        menace_first: If True, MENACE is X and moves first
+        rand: Source of random numbers in [0, 1) for the bot's moves
+
+    Returns:
+        Tuple of (MENACE's moves, result from MENACE's perspective)
+    """
+    menace.reset_game()
+    menace_player = Player.X if menace_first else Player.O
+    bot_player = menace_player.other
+    menace.player = menace_player
+
+    # The whole state of the game is one reference to a shared, pooled
+    # Board. Boards remember the moves played from them and their own
+    # status, so each step below is a couple of lookups.
+    board = Board()
+    menace_turn = menace_first
+
+    while True:
+        if menace_turn:
+            position = menace.get_move(board)
+            board = board.make_move(position, menace_player)
+        else:
+            empty = board.get_empty_positions()
+            position = empty[int(rand() * len(empty))]
+            board = board.make_move(position, bot_player)
+
+        if board.is_game_over():
+            break
+        menace_turn = not menace_turn
+
+    # Hand the moves to the caller and leave MENACE ready for the next game
+    moves = menace.move_history
+    menace.move_history = []
+    return moves, board.get_result(menace_player)
@@ -28,14 +28,43 @@ This file will be created automatically when the app starts.
 """
 
 import sqlite3
-import json
+import threading
 from pathlib import Path
 from typing import Optional
 from contextlib import contextmanager
 
+import orjson
+
 # Database file path (relative to this file's location)
 DB_PATH = Path(__file__).parent.parent.parent / "menace.db"
 
+# One open connection per thread (see get_db)
+_local = threading.local()
+
+# Insert a matchbox, or update it if its board state is already stored.
+# Shared by save_matchbox and save_all_matchboxes.
+UPSERT_MATCHBOX_SQL = """
+    INSERT INTO matchboxes (board_state, beads, times_used, updated_at)
+    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(board_state) DO UPDATE SET
+        beads = excluded.beads,
+        times_used = excluded.times_used,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+
+def encode_beads(beads: dict) -> str:
+    """
+    Encode a matchbox's beads for the beads column.
+
+    Uses orjson (already needed for the API's responses) instead of the
+    json module: bulk saves encode one small dict per matchbox, and
+    orjson does that several times faster. orjson writes compact JSON,
+    '{"0":3,"4":5}', where json.dumps wrote '{"0": 3, "4": 5}'. The text
+    differs but the data doesn't, so rows written either way load the same.
+    """
+    return orjson.dumps(beads, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 def get_connection() -> sqlite3.Connection:
     """
@@ -47,6 +76,29 @@ def get_connection() -> sqlite3.Connection:
     conn = sqlite3.connect(str(DB_PATH))
     # Return rows as dictionaries instead of tuples
     conn.row_factory = sqlite3.Row
+    # In WAL mode (see init_db) this is still crash-safe, but commits no
+    # longer wait for the disk to confirm every write
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _thread_connection() -> sqlite3.Connection:
+    """
+    Get this thread's connection, opening it on first use.
+
+    A connection remembers the statements it has already compiled (its
+    statement cache), so reusing one connection means each of this
+    module's SQL strings is parsed once rather than on every call.
+    SQLite connections can't be shared between threads, hence one per
+    thread.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        conn = get_connection()
+        _local.conn = conn
+        _local.path = DB_PATH
     return conn
 
 
@@ -60,17 +112,25 @@ def get_db():
             cursor = conn.execute("SELECT * FROM matchboxes")
             rows = cursor.fetchall()
 
-    This ensures the connection is properly closed even if an error occurs.
+    Everything inside the block is one transaction: it is committed at
+    the end, or rolled back if an error occurs. The connection itself
+    stays open for the next call (see close_db).
     """
-    conn = get_connection()
+    conn = _thread_connection()
     try:
         yield conn
         conn.commit()
     except Exception:
         conn.rollback()
         raise
-    finally:
+
+
+def close_db():
+    """Close this thread's database connection, if it has one."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
         conn.close()
+        _local.conn = None
 
 
 def init_db():
@@ -81,6 +141,11 @@ def init_db():
     Safe to call multiple times - won't overwrite existing data.
     """
     with get_db() as conn:
+        # Write-ahead logging: writers append to a log instead of rewriting
+        # the database file, which makes big batches of writes much faster.
+        # The setting is stored in the database file, so once is enough.
+        conn.execute("PRAGMA journal_mode=WAL")
+
         # Matchboxes table - stores MENACE's learned states
         conn.execute(
             """
@@ -142,6 +207,17 @@ def init_db():
         """
         )
 
+        # Checkpoint - MENACE's whole state (Menace.to_dict()) as one blob
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS menace_checkpoint (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                data BLOB NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
         # Insert default MENACE state if not exists
         conn.execute(
             """
@@ -161,6 +237,7 @@ def reset_db():
         conn.execute("DROP TABLE IF EXISTS games")
         conn.execute("DROP TABLE IF EXISTS stats_snapshots")
         conn.execute("DROP TABLE IF EXISTS menace_state")
+        conn.execute("DROP TABLE IF EXISTS menace_checkpoint")
 
     init_db()
 
@@ -181,15 +258,7 @@ def save_matchbox(board_state: str, beads: dict, times_used: int = 0):
     """
     with get_db() as conn:
         conn.execute(
-            """
-            INSERT INTO matchboxes (board_state, beads, times_used, updated_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(board_state) DO UPDATE SET
-                beads = excluded.beads,
-                times_used = excluded.times_used,
-                updated_at = CURRENT_TIMESTAMP
-        """,
-            (board_state, json.dumps(beads), times_used),
+            UPSERT_MATCHBOX_SQL, (board_state, encode_beads(beads), times_used)
         )
 
 
@@ -214,7 +283,7 @@ def load_matchbox(board_state: str) -> Optional[dict]:
 
         return {
             "board_state": row["board_state"],
-            "beads": json.loads(row["beads"]),
+            "beads": orjson.loads(row["beads"]),
             "times_used": row["times_used"],
         }
 
@@ -223,20 +292,22 @@ def load_all_matchboxes() -> list:
     """
     Load all matchboxes from the database.
 
+    This reads every matchbox at once, so it asks only for the three
+    columns it needs and reads them as plain tuples, skipping
+    the sqlite3.Row wrapper the other queries use.
+
     Returns:
         List of matchbox dictionaries
     """
     with get_db() as conn:
-        cursor = conn.execute("SELECT * FROM matchboxes")
-        rows = cursor.fetchall()
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute("SELECT board_state, beads, times_used FROM matchboxes")
 
+        loads = orjson.loads
         return [
-            {
-                "board_state": row["board_state"],
-                "beads": json.loads(row["beads"]),
-                "times_used": row["times_used"],
-            }
-            for row in rows
+            {"board_state": state, "beads": loads(beads), "times_used": times_used}
+            for state, beads, times_used in cursor
         ]
 
 
@@ -244,22 +315,21 @@ def save_all_matchboxes(matchboxes: list):
     """
     Save multiple matchboxes to the database efficiently.
 
+    All rows are written by one executemany() call in one transaction, so
+    SQLite runs the same statement for every row instead of Python
+    handing it over row by row.
+
     Args:
         matchboxes: List of matchbox dictionaries
     """
     with get_db() as conn:
-        for mb in matchboxes:
-            conn.execute(
-                """
-                INSERT INTO matchboxes (board_state, beads, times_used, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                ON CONFLICT(board_state) DO UPDATE SET
-                    beads = excluded.beads,
-                    times_used = excluded.times_used,
-                    updated_at = CURRENT_TIMESTAMP
-            """,
-                (mb["board_state"], json.dumps(mb["beads"]), mb["times_used"]),
-            )
+        conn.executemany(
+            UPSERT_MATCHBOX_SQL,
+            (
+                (mb["board_state"], encode_beads(mb["beads"]), mb["times_used"])
+                for mb in matchboxes
+            ),
+        )
 
 
 # ============================================================================
@@ -283,7 +353,7 @@ def save_game(game_id: str, result: str, menace_player: str, moves: list):
             INSERT INTO games (id, result, menace_player, moves)
             VALUES (?, ?, ?, ?)
         """,
-            (game_id, result, menace_player, json.dumps(moves)),
+            (game_id, result, menace_player, orjson.dumps(moves).decode()),
         )
 
 
@@ -308,7 +378,7 @@ def get_game_history(limit: int = 100) -> list:
                 "id": row["id"],
                 "result": row["result"],
                 "menace_player": row["menace_player"],
-                "moves": json.loads(row["moves"]),
+                "moves": orjson.loads(row["moves"]),
                 "created_at": row["created_at"],
             }
             for row in rows
@@ -448,3 +518,46 @@ def load_menace_state() -> dict:
             "draw_reward": row["draw_reward"],
             "loss_penalty": row["loss_penalty"],
         }
+
+
+# ============================================================================
+# Checkpoint Operations
+# ============================================================================
+
+
+def save_menace_checkpoint(state: dict):
+    """
+    Save MENACE's complete state as a single row.
+
+    Saving matchbox by matchbox means one upsert per matchbox. When all
+    that's needed is a snapshot to restore later (e.g. after a long
+    training run), writing the whole Menace.to_dict() as one orjson blob
+    is a single write instead.
+
+    Args:
+        state: The result of Menace.to_dict()
+    """
+    with get_db() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO menace_checkpoint (id, data, updated_at)
+            VALUES (1, ?, CURRENT_TIMESTAMP)
+        """,
+            (orjson.dumps(state, option=orjson.OPT_NON_STR_KEYS),),
+        )
+
+
+def load_menace_checkpoint() -> Optional[dict]:
+    """
+    Load the state saved by save_menace_checkpoint.
+
+    Returns:
+        A dictionary for Menace.from_dict(), or None if there is no checkpoint
+    """
+    with get_db() as conn:
+        row = conn.execute("SELECT data FROM menace_checkpoint WHERE id = 1").fetchone()
+
+        if row is None:
+            return None
+
+        return orjson.loads(row["data"])
@@ -6,14 +6,28 @@ Simple dataclasses representing database records.
 NOTE: We're using simple dataclasses instead of a full ORM like SQLAlchemy.
 This keeps things simpler for learning purposes. In a larger project,
 you might want to use SQLAlchemy for more complex queries and relationships.
+
+The models use __slots__ where Python supports it for dataclasses
+(3.10+): each record stores its fields directly instead of in a
+per-object dict, so thousands of loaded rows take noticeably less memory.
+
+Timestamps are stored as plain time.time() numbers (like game.Move
+does) - building a datetime for every record is much slower. Each model
+still has datetime properties (created_at etc.) for code that needs one.
 """
 
+import sys
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List
 
+# dataclass(slots=True) is new in Python 3.10; on 3.9 the models simply
+# keep their regular __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class MatchboxModel:
     """
     Database model for a matchbox.
@@ -24,11 +38,21 @@ class MatchboxModel:
     board_state: str
     beads: Dict[int, int]
     times_used: int = 0
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    created_ts: float = field(default_factory=time.time)  # Seconds since the epoch
+    updated_ts: float = field(default_factory=time.time)
+
+    @property
+    def created_at(self) -> datetime:
+        """When the matchbox was created."""
+        return datetime.fromtimestamp(self.created_ts)
+
+    @property
+    def updated_at(self) -> datetime:
+        """When the matchbox was last updated."""
+        return datetime.fromtimestamp(self.updated_ts)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class GameModel:
     """
     Database model for a completed game.
@@ -40,10 +64,15 @@ class GameModel:
     result: str  # 'win', 'loss', 'draw'
     menace_player: str  # 'X' or 'O'
     moves: List[dict]
-    created_at: datetime = field(default_factory=datetime.now)
+    created_ts: float = field(default_factory=time.time)  # Seconds since the epoch
+
+    @property
+    def created_at(self) -> datetime:
+        """When the game was saved."""
+        return datetime.fromtimestamp(self.created_ts)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StatsSnapshot:
     """
     Database model for a statistics snapshot.
@@ -59,25 +88,25 @@ class StatsSnapshot:
     draws: int
     matchbox_count: int
     total_beads: int
-    snapshot_at: datetime = field(default_factory=datetime.now)
-
-    @property
-    def win_rate(self) -> float:
-        """Calculate win rate."""
-        if self.games_played == 0:
-            return 0.0
-        return self.wins / self.games_played
-
-    @property
-    def loss_rate(self) -> float:
-        """Calculate loss rate."""
-        if self.games_played == 0:
-            return 0.0
-        return self.losses / self.games_played
+    snapshot_ts: float = field(default_factory=time.time)  # Seconds since the epoch
+
+    # Derived rates - a snapshot never changes, so they are worked out
+    # once when it is created instead of on every access
+    win_rate: float = field(init=False, compare=False)
+    loss_rate: float = field(init=False, compare=False)
+    draw_rate: float = field(init=False, compare=False)
+
+    def __post_init__(self):
+        """Calculate the win, loss and draw rates."""
+        games = self.games_played
+        if games == 0:
+            self.win_rate = self.loss_rate = self.draw_rate = 0.0
+        else:
+            self.win_rate = self.wins / games
+            self.loss_rate = self.losses / games
+            self.draw_rate = self.draws / games
 
     @property
-    def draw_rate(self) -> float:
-        """Calculate draw rate."""
-        if self.games_played == 0:
-            return 0.0
-        return self.draws / self.games_played
+    def snapshot_at(self) -> datetime:
+        """When the snapshot was taken."""
+        return datetime.fromtimestamp(self.snapshot_ts)
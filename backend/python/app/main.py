@@ -9,19 +9,35 @@ Key Concepts:
 - FastAPI(): Creates our web application
 - CORS: Allows our React frontend to talk to this backend
 - Routers: Organize our API endpoints into logical groups
+
+Configuration:
+- MENACE_ENABLE_DOCS=0 turns off the /docs and /redoc pages and the
+  OpenAPI schema at /openapi.json (for production), so the schema is
+  never built and the long API description isn't kept around.
 """
 
+import os
+from contextlib import asynccontextmanager
+
+import orjson
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # Import our API routes (we'll create these next)
-from app.api.routes import router as api_router
+from app.api.routes import router as api_router, health_check
 
-# Create the FastAPI application
-# The metadata here shows up in the automatic documentation
-app = FastAPI(
-    title="MENACE API",
-    description="""
+# Interactive docs are on by default (handy in development); production
+# deployments can switch them off with MENACE_ENABLE_DOCS=0
+ENABLE_DOCS = os.getenv("MENACE_ENABLE_DOCS", "1") != "0"
+
+# Shown at the top of the docs pages
+DESCRIPTION = """
     ## Machine Educable Noughts And Crosses Engine
     
     This API provides endpoints to:
@@ -31,12 +47,87 @@ app = FastAPI(
     
     MENACE learns through reinforcement learning, adjusting its strategy
     based on game outcomes.
-    """,
+    """
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Runs around the whole life of the server.
+
+    Everything before the `yield` runs once when the server starts, and
+    everything after it once when it shuts down. One function for both
+    (instead of separate startup/shutdown handlers) keeps setup and
+    cleanup side by side.
+
+    This is where we'll:
+    - Initialize database connections and load MENACE's learned state
+    - Save MENACE's learned state and close the connections again
+    """
+    print("🎮 MENACE API starting up...")
+
+    # Build the OpenAPI schema now. FastAPI keeps it once built, but
+    # otherwise the first /openapi.json (or /docs) visitor waits while it
+    # is generated from every route and Pydantic model. With the docs
+    # turned off nobody can ask for it, so it is never built at all.
+    if app.openapi_url:
+        app.openapi()
+
+    # TODO: Initialize database
+    # TODO: Load MENACE state
+    print("✅ MENACE API ready!")
+
+    yield
+
+    print("💾 Saving MENACE state...")
+    # TODO: Save state
+    print("👋 MENACE API shutting down")
+
+
+# Create the FastAPI application
+# The metadata here shows up in the automatic documentation
+app = FastAPI(
+    title="MENACE API",
+    description=DESCRIPTION if ENABLE_DOCS else "",
     version="0.1.0",
-    docs_url="/docs",  # Swagger UI at /docs
-    redoc_url="/redoc",  # ReDoc at /redoc
+    docs_url="/docs" if ENABLE_DOCS else None,  # Swagger UI at /docs
+    redoc_url="/redoc" if ENABLE_DOCS else None,  # ReDoc at /redoc
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,  # The raw schema
+    # Serialize every response with orjson (a fast C encoder) instead of
+    # the standard library's pure-Python json module
+    default_response_class=ORJSONResponse,
+    # Startup and shutdown work (see lifespan above)
+    lifespan=lifespan,
 )
 
+
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that gets out of the way of non-CORS requests.
+
+    CORS only matters for requests that carry an Origin header (browsers
+    add it to cross-origin requests). Everything else - curl, health
+    checks, server-to-server calls - is passed straight to the app after
+    a quick look at the raw headers, without building a Headers object.
+    The allowed origins are also kept as a frozenset, so checking an
+    origin is a hash lookup instead of a scan through the list.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    break
+            else:
+                await self.app(scope, receive, send)
+                return
+        await super().__call__(scope, receive, send)
+
+
 # Configure CORS (Cross-Origin Resource Sharing)
 # This is ESSENTIAL for the React frontend to communicate with our backend
 #
@@ -46,7 +137,7 @@ app = FastAPI(
 # FastAPI backend runs on port 8000. Without CORS, the browser would block
 # all requests from React to FastAPI.
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     # Which origins (domains) can access our API
     allow_origins=[
         "http://localhost:3000",  # React dev server
@@ -62,49 +153,69 @@ app.add_middleware(
     allow_headers=["*"],  # All headers
 )
 
+
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """
+    GZip middleware that only looks at a few listed paths.
+
+    Most of our responses are a few hundred bytes of JSON, where
+    compressing costs more time than it saves on the wire. Requests to
+    any other path go straight to the app without passing through the
+    compression machinery at all.
+    """
+
+    def __init__(self, app: ASGIApp, paths: tuple, **kwargs) -> None:
+        super().__init__(app, **kwargs)
+        self.paths = paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.paths):
+            await super().__call__(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+# Compress the endpoints that can return large lists (hundreds of
+# matchboxes, thousands of history points). Even there, bodies under 2 KB
+# are sent as-is, and level 1 is used because it is several times faster
+# than the default 9 while still shrinking repetitive JSON a lot.
+app.add_middleware(
+    SelectiveGZipMiddleware,
+    paths=("/api/menace/matchboxes", "/api/menace/history"),
+    minimum_size=2048,
+    compresslevel=1,
+)
+
+# Health check - registered as a bare route (no FastAPI validation or
+# dependency injection) because monitoring tools call it constantly
+app.add_route("/api/health", health_check, methods=["GET"])
+
 # Include our API routes
 # The prefix means all routes in api_router will start with /api
 # So if we have a route "/game/new", it becomes "/api/game/new"
 app.include_router(api_router, prefix="/api")
 
 
+# The root endpoint's answer never changes, so it is encoded to JSON once
+# here instead of on every request
+_ROOT_RESPONSE = Response(
+    content=orjson.dumps(
+        {"message": "Welcome to MENACE API", "docs": "/docs", "status": "running"}
+    ),
+    media_type="application/json",
+)
+
+
 # Root endpoint - just a health check / welcome message
-@app.get("/")
-async def root():
+async def root(request: Request) -> Response:
     """
     Root endpoint - confirms the API is running.
 
     This is a simple health check. If you can reach this endpoint,
     the server is up and running!
     """
-    return {"message": "Welcome to MENACE API", "docs": "/docs", "status": "running"}
-
+    return _ROOT_RESPONSE
 
-# Event handlers for startup/shutdown
-@app.on_event("startup")
-async def startup_event():
-    """
-    Runs when the server starts.
-
-    This is where we'll initialize:
-    - Database connections
-    - Load MENACE's learned state
-    """
-    print("🎮 MENACE API starting up...")
-    # TODO: Initialize database
-    # TODO: Load MENACE state
-    print("✅ MENACE API ready!")
 
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Runs when the server shuts down.
-
-    This is where we'll:
-    - Save MENACE's learned state
-    - Close database connections
-    """
-    print("💾 Saving MENACE state...")
-    # TODO: Save state
-    print("👋 MENACE API shutting down")
+# A bare route like /api/health: no validation or dependencies to run
+app.add_route("/", root, methods=["GET"])
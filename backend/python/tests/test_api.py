@@ -0,0 +1,448 @@
+"""
+Tests for the HTTP API.
+
+These tests drive the FastAPI app through Starlette's TestClient and check
+that:
+- The read-only MENACE endpoints answer repeat requests with 304 Not Modified
+- Their ETags change whenever MENACE does, including across a reset
+- The learning history is served in pages
+- Single matchbox lookups wait for training to finish its game
+- The cached matchbox list is rebuilt whenever MENACE changes
+- A reset hands later requests a fresh MENACE and game manager
+- Only the large list endpoints are gzip-compressed
+- CORS headers are added for the frontend origins only
+"""
+
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.main import app
+
+
+@pytest.fixture
+def client():
+    """A test client talking to a freshly reset MENACE."""
+    with TestClient(app) as client:
+        client.post("/api/menace/reset")
+        yield client
+
+
+def play_menace_move(client) -> None:
+    """Start a game with MENACE moving first, which changes MENACE."""
+    response = client.post("/api/game/new", json={"menace_plays_first": True})
+    assert response.status_code == 200
+
+
+def play_full_game(client) -> None:
+    """Play a game to the end against MENACE, so that it learns."""
+    game = client.post("/api/game/new", json={"menace_plays_first": True}).json()
+    while True:
+        state = client.get(f"/api/game/{game['game_id']}").json()
+        if state["is_game_over"]:
+            return
+        client.post(
+            f"/api/game/{game['game_id']}/move",
+            json={"position": state["valid_moves"][0]},
+        )
+
+
+class TestETags:
+    """Test HTTP caching of the read-only MENACE endpoints."""
+
+    ENDPOINTS = ["/api/menace/stats", "/api/menace/matchboxes", "/api/menace/history"]
+
+    @pytest.mark.parametrize("path", ENDPOINTS)
+    def test_responses_carry_etag_and_cache_control(self, client, path):
+        """Every response says how it may be cached."""
+        response = client.get(path)
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+        assert response.headers["Cache-Control"] == "private, max-age=1"
+
+    @pytest.mark.parametrize("path", ENDPOINTS)
+    def test_matching_etag_gets_empty_304(self, client, path):
+        """A client that already has the current data gets no body back."""
+        etag = client.get(path).headers["ETag"]
+
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "private, max-age=1"
+
+    def test_etag_lists_and_wildcard_match(self, client):
+        """If-None-Match may list several tags, or match anything with *."""
+        etag = client.get("/api/menace/stats").headers["ETag"]
+
+        listed = client.get(
+            "/api/menace/stats", headers={"If-None-Match": f'W/"x", {etag}'}
+        )
+        wildcard = client.get("/api/menace/stats", headers={"If-None-Match": "*"})
+
+        assert listed.status_code == 304
+        assert wildcard.status_code == 304
+
+    @pytest.mark.parametrize("path", ENDPOINTS)
+    def test_etag_changes_after_a_move(self, client, path):
+        """Once MENACE moves, the old tag no longer matches."""
+        etag = client.get(path).headers["ETag"]
+
+        play_menace_move(client)
+        response = client.get(path, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_reset_never_reuses_an_etag(self, client):
+        """A fresh MENACE starts at version 0 again, but with new tags."""
+        before = {client.get("/api/menace/stats").headers["ETag"]}
+        for _ in range(3):
+            play_menace_move(client)
+            before.add(client.get("/api/menace/stats").headers["ETag"])
+
+        client.post("/api/menace/reset")
+
+        after = {client.get("/api/menace/stats").headers["ETag"]}
+        for _ in range(3):
+            play_menace_move(client)
+            after.add(client.get("/api/menace/stats").headers["ETag"])
+
+        assert before.isdisjoint(after)
+
+    def test_pre_reset_etag_gets_full_response(self, client):
+        """A tag from before the reset doesn't hide the fresh MENACE."""
+        etag = client.get("/api/menace/stats").headers["ETag"]
+
+        client.post("/api/menace/reset")
+        response = client.get("/api/menace/stats", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["games_played"] == 0
+
+
+class TestHistoryPaging:
+    """Test the since/limit paging of /menace/history."""
+
+    @pytest.fixture
+    def trained(self, client):
+        """A client whose MENACE has 20 history snapshots."""
+        client.post("/api/training/self-play", json={"num_games": 20})
+        return client
+
+    def test_defaults_return_everything(self, trained):
+        """Without paging parameters all snapshots fit in one page."""
+        data = trained.get("/api/menace/history").json()
+
+        assert data["total_snapshots"] == 20
+        assert len(data["history"]) == 20
+        assert data["history"][-1]["games"] == data["current_games"] == 20
+
+    def test_default_includes_newest_of_a_long_history(self, client):
+        """Unpaged requests get every snapshot, however many there are."""
+        # 90,000 games leave 1080 snapshots - more than fits in one page of
+        # a limited request
+        client.post("/api/training/self-play", json={"num_games": 90000})
+
+        data = client.get("/api/menace/history").json()
+        page = client.get("/api/menace/history?limit=1000").json()
+
+        assert data["total_snapshots"] == 1080
+        assert len(data["history"]) == 1080
+        assert data["history"][-1]["games"] == data["current_games"] == 90000
+        assert len(page["history"]) == 1000
+        assert page["history"] == data["history"][:1000]
+
+    def test_since_and_limit_select_a_page(self, trained):
+        """since skips snapshots and limit caps the page size."""
+        everything = trained.get("/api/menace/history").json()["history"]
+
+        data = trained.get("/api/menace/history?since=5&limit=3").json()
+
+        assert data["history"] == everything[5:8]
+        assert data["total_snapshots"] == 20
+
+    def test_pages_cover_the_whole_history(self, trained):
+        """Fetching page after page yields every snapshot exactly once."""
+        everything = trained.get("/api/menace/history").json()["history"]
+
+        pages = []
+        since = 0
+        while True:
+            data = trained.get(f"/api/menace/history?since={since}&limit=7").json()
+            if not data["history"]:
+                break
+            pages.extend(data["history"])
+            since += len(data["history"])
+
+        assert pages == everything
+
+    def test_since_past_the_end_is_empty(self, trained):
+        """Asking beyond the last snapshot is not an error."""
+        response = trained.get("/api/menace/history?since=1000")
+
+        assert response.status_code == 200
+        assert response.json()["history"] == []
+        assert response.json()["total_snapshots"] == 20
+
+    def test_limit_maximum(self, trained):
+        """limit accepts up to 10000 and rejects anything larger."""
+        assert trained.get("/api/menace/history?limit=10000").status_code == 200
+        assert trained.get("/api/menace/history?limit=10001").status_code == 422
+
+    @pytest.mark.parametrize("query", ["since=-1", "limit=0"])
+    def test_out_of_range_parameters_are_rejected(self, trained, query):
+        """Negative offsets and empty pages are invalid."""
+        assert trained.get(f"/api/menace/history?{query}").status_code == 422
+
+
+class TestTraining:
+    """Test /training/self-play."""
+
+    @pytest.mark.parametrize("opponent", ["random", "optimal"])
+    def test_self_play(self, client, opponent):
+        """Both opponent types train MENACE (optimal plays randomly for now)."""
+        response = client.post(
+            "/api/training/self-play",
+            json={"num_games": 30, "opponent": opponent},
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["wins"] + data["losses"] + data["draws"] == 30
+        assert client.get("/api/menace/stats").json()["games_played"] == 30
+
+
+class TestMatchboxQuery:
+    """Test /menace/matchbox."""
+
+    def test_query_matchbox(self, client):
+        """A known state returns its beads and matching probabilities."""
+        play_menace_move(client)
+
+        response = client.post(
+            "/api/menace/matchbox", json={"board_state": "_________"}
+        )
+
+        data = response.json()
+        assert response.status_code == 200
+        assert data["times_used"] == 1
+        assert data["probabilities"].keys() == data["beads"].keys()
+        assert sum(data["probabilities"].values()) == pytest.approx(1.0)
+
+    def test_unknown_state(self, client):
+        """States MENACE hasn't seen are a 404."""
+        response = client.post(
+            "/api/menace/matchbox", json={"board_state": "X___O____"}
+        )
+
+        assert response.status_code == 404
+
+    def test_query_waits_for_menace_lock(self, client):
+        """The lookup doesn't read beads while training holds the lock."""
+        play_menace_move(client)
+        responses = []
+
+        def query():
+            responses.append(
+                client.post("/api/menace/matchbox", json={"board_state": "_________"})
+            )
+
+        thread = threading.Thread(target=query)
+        with routes.menace_lock:
+            thread.start()
+            thread.join(0.2)
+            assert responses == []
+
+        thread.join(5)
+        assert responses[0].status_code == 200
+
+
+class TestMatchboxListCache:
+    """Test that the cached /menace/matchboxes body never goes stale."""
+
+    @staticmethod
+    def listing_matches_menace(client) -> bool:
+        """Check the listed matchboxes against the live MENACE."""
+        listed = client.get("/api/menace/matchboxes").json()
+        menace = routes.get_menace()
+        expected = {
+            state: ({str(pos): n for pos, n in mb.beads.items()}, mb.times_used)
+            for state, mb in menace.matchboxes.items()
+        }
+        actual = {
+            mb["board_state"]: (mb["beads"], mb["times_used"])
+            for mb in listed["matchboxes"]
+        }
+        return listed["count"] == len(expected) and actual == expected
+
+    def test_unchanged_menace_is_served_from_cache(self, client):
+        """Repeat requests get the stored bytes back."""
+        play_menace_move(client)
+        first = client.get("/api/menace/matchboxes")
+        second = client.get("/api/menace/matchboxes")
+
+        assert second.content == first.content
+        assert routes._matchbox_list_cache[2] == second.content
+
+    def test_listing_follows_moves_learning_and_reset(self, client):
+        """The listing is rebuilt after every change to MENACE."""
+        assert client.get("/api/menace/matchboxes").json()["count"] == 0
+
+        # A move creates (or uses) a matchbox
+        play_menace_move(client)
+        assert client.get("/api/menace/matchboxes").json()["count"] == 1
+        assert self.listing_matches_menace(client)
+
+        # Finishing a game changes the bead counts
+        before = client.get("/api/menace/matchboxes").content
+        play_full_game(client)
+        assert client.get("/api/menace/matchboxes").content != before
+        assert self.listing_matches_menace(client)
+
+        # A reset brings back an empty MENACE
+        client.post("/api/menace/reset")
+        assert client.get("/api/menace/matchboxes").json() == {
+            "count": 0,
+            "matchboxes": [],
+        }
+
+
+class TestReset:
+    """Test /menace/reset."""
+
+    def test_reset_provides_fresh_instances(self, client):
+        """After a reset the providers build new objects."""
+        play_full_game(client)
+        old_menace = routes.get_menace()
+        old_manager = routes.get_game_manager(old_menace)
+        assert old_menace.games_played == 1
+
+        response = client.post("/api/menace/reset")
+
+        assert response.status_code == 200
+        menace = routes.get_menace()
+        manager = routes.get_game_manager(menace)
+        assert menace is not old_menace
+        assert manager is not old_manager
+        assert manager.menace is menace
+        assert menace.games_played == 0
+        assert len(menace.matchboxes) == 0
+
+    def test_requests_after_reset_use_fresh_state(self, client):
+        """Games started before a reset are gone, and the stats start over."""
+        game = client.post("/api/game/new", json={"menace_plays_first": True}).json()
+        play_full_game(client)
+
+        client.post("/api/menace/reset")
+
+        assert client.get(f"/api/game/{game['game_id']}").status_code == 404
+        assert client.get("/api/menace/stats").json()["games_played"] == 0
+        assert client.get("/api/health").json()["active_games"] == 0
+
+
+class TestGZip:
+    """Test which responses SelectiveGZipMiddleware compresses."""
+
+    @pytest.fixture
+    def trained(self, client):
+        """A client whose MENACE has enough data for multi-KB lists."""
+        client.post("/api/training/self-play", json={"num_games": 300})
+        return client
+
+    @pytest.mark.parametrize("path", ["/api/menace/matchboxes", "/api/menace/history"])
+    def test_large_lists_are_compressed(self, trained, path):
+        """Listed paths are gzipped once they reach 2048 bytes."""
+        response = trained.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert len(response.content) >= 2048
+        assert response.headers["Content-Encoding"] == "gzip"
+
+    @pytest.mark.parametrize("path", ["/api/menace/matchboxes", "/api/menace/history"])
+    def test_small_lists_are_not_compressed(self, client, path):
+        """Bodies under 2048 bytes are sent as they are."""
+        response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+        assert len(response.content) < 2048
+        assert "Content-Encoding" not in response.headers
+
+    @pytest.mark.skipif(app.openapi_url is None, reason="API docs are turned off")
+    def test_other_paths_are_not_compressed(self, client):
+        """Large responses on other paths are never compressed."""
+        response = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+
+        assert len(response.content) >= 2048
+        assert "Content-Encoding" not in response.headers
+
+    def test_no_compression_unless_accepted(self, trained):
+        """Clients that don't accept gzip get plain JSON."""
+        response = trained.get(
+            "/api/menace/matchboxes", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert len(response.content) >= 2048
+        assert "Content-Encoding" not in response.headers
+
+
+class TestCORS:
+    """Test FastCORSMiddleware."""
+
+    ALLOWED = "http://localhost:5173"
+    DISALLOWED = "http://evil.example"
+
+    def test_request_without_origin_skips_cors(self, client):
+        """Non-browser clients get no CORS headers at all."""
+        response = client.get("/api/menace/stats")
+
+        assert response.status_code == 200
+        assert "Access-Control-Allow-Origin" not in response.headers
+        assert "Vary" not in response.headers
+
+    def test_allowed_origin(self, client):
+        """The frontend's origin is echoed back, with credentials."""
+        response = client.get("/api/menace/stats", headers={"Origin": self.ALLOWED})
+
+        assert response.status_code == 200
+        assert response.headers["Access-Control-Allow-Origin"] == self.ALLOWED
+        assert response.headers["Access-Control-Allow-Credentials"] == "true"
+        assert "Origin" in response.headers["Vary"]
+
+    def test_disallowed_origin(self, client):
+        """Other origins get the response but no permission to read it."""
+        response = client.get("/api/menace/stats", headers={"Origin": self.DISALLOWED})
+
+        assert response.status_code == 200
+        assert "Access-Control-Allow-Origin" not in response.headers
+
+    def test_preflight_from_allowed_origin(self, client):
+        """Preflights for the frontend are answered by the middleware."""
+        response = client.options(
+            "/api/game/new",
+            headers={
+                "Origin": self.ALLOWED,
+                "Access-Control-Request-Method": "POST",
+                "Access-Control-Request-Headers": "content-type",
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Access-Control-Allow-Origin"] == self.ALLOWED
+        assert "POST" in response.headers["Access-Control-Allow-Methods"]
+        assert response.headers["Access-Control-Allow-Headers"] == "content-type"
+
+    def test_preflight_from_disallowed_origin(self, client):
+        """Preflights from other origins are refused."""
+        response = client.options(
+            "/api/game/new",
+            headers={
+                "Origin": self.DISALLOWED,
+                "Access-Control-Request-Method": "POST",
+            },
+        )
+
+        assert response.status_code == 400
+        assert "Access-Control-Allow-Origin" not in response.headers
@@ -8,6 +8,9 @@ These tests verify that the Board class correctly:
 - Normalizes equivalent states
 """
 
+import copy
+import pickle
+
 import pytest
 from app.core.board import Board, Player, GameResult
 
@@ -39,6 +42,66 @@ class TestBoardBasics:
             Board("X_O__Y___")  # Y is not valid
 
 
+class TestBitboards:
+    """Test the bitboard representation behind the state string."""
+
+    def test_masks_match_state(self):
+        """Bit p of each mask should be set where that player has a piece."""
+        board = Board("X_O__X___")
+        assert board._x == 0b000100001
+        assert board._o == 0b000000100
+
+    def test_moves_build_equal_boards(self):
+        """A board built by moves should equal one parsed from its string."""
+        board = Board().make_move(0, Player.X).make_move(8, Player.O)
+        parsed = Board("X_______O")
+
+        assert board == parsed
+        assert hash(board) == hash(parsed)
+        assert board.state == "X_______O"
+
+    def test_boards_are_shared(self):
+        """Each position should have exactly one Board object."""
+        assert Board("X_______O") is Board("X_______O")
+        assert Board().make_move(4, Player.X) is Board("____X____")
+
+    def test_copies_are_the_shared_board(self):
+        """Copying a board hands back the pooled object itself."""
+        board = Board("X___O____")
+
+        assert copy.copy(board) is board
+        assert copy.deepcopy(board) is board
+        assert copy.deepcopy([board, Board()]) == [board, Board()]
+
+    def test_pickle_round_trip_keeps_pool_intact(self):
+        """Unpickling finds the pooled board instead of rewriting another."""
+        board = Board("X___O____")
+
+        restored = pickle.loads(pickle.dumps(board))
+
+        assert restored is board
+        assert Board().state == "_________"
+        assert Board()._x == Board()._o == 0
+
+    def test_deepcopy_keeps_empty_board_intact(self):
+        """A deep copy must not overwrite the shared empty board."""
+        copy.deepcopy(Board("X___O____"))
+
+        assert Board().state == "_________"
+        assert Board().get_empty_positions() == tuple(range(9))
+
+    def test_first_winning_line_table(self):
+        """The table should name the first completed line, or 8 for none."""
+        assert Board.FIRST_WINNING_LINE[0b000000111] == 0  # Top row
+        assert Board.FIRST_WINNING_LINE[0b100010001] == 6  # Diagonal
+        assert Board.FIRST_WINNING_LINE[0b000010011] == 8  # No line
+
+    def test_winning_masks_match_lines(self):
+        """Each winning mask should have exactly its line's three bits set."""
+        for line, mask in zip(Board.WINNING_LINES, Board.WINNING_MASKS):
+            assert [p for p in range(9) if mask >> p & 1] == list(line)
+
+
 class TestBoardMoves:
     """Test making moves on the board."""
 
@@ -72,13 +135,13 @@ class TestBoardMoves:
     def test_get_empty_positions(self):
         """Should correctly identify empty positions."""
         board = Board("X_O__X___")
-        expected = [1, 3, 4, 6, 7, 8]
+        expected = (1, 3, 4, 6, 7, 8)
         assert board.get_empty_positions() == expected
 
     def test_get_empty_positions_full_board(self):
         """Full board should have no empty positions."""
         board = Board("XOXOXOXOX")
-        assert board.get_empty_positions() == []
+        assert board.get_empty_positions() == ()
 
 
 class TestWinDetection:
@@ -187,6 +250,21 @@ class TestNormalization:
         # All should be the same
         assert all(s == normalized_states[0] for s in normalized_states)
 
+    def test_normalize_picks_alphabetically_smallest(self):
+        """The canonical form is the first of the 8 variants alphabetically."""
+        for state in ["X___O____", "_O__X___X", "XO_X_O___", "OX_______"]:
+            variants = [
+                ("".join(state[pos] for pos in transform), i)
+                for i, transform in enumerate(Board.TRANSFORMATIONS)
+            ]
+            assert Board(state).normalize() == min(variants)
+
+    def test_normalized_states_are_interned(self):
+        """Equivalent boards should share one normalized string object."""
+        first, _ = Board("X________").normalize()
+        second, _ = Board("________X").normalize()
+        assert first is second
+
     def test_position_transformation(self):
         """Should correctly transform positions."""
         board = Board()
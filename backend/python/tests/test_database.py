@@ -0,0 +1,304 @@
+"""
+Tests for the database module.
+
+Every test runs against its own SQLite file in a temporary directory, so
+the real menace.db is never touched. These tests verify that:
+- Matchboxes and games survive a save/load round trip
+- A whole MENACE survives a checkpoint round trip
+- Each thread reuses one connection, and get_db() blocks are transactions
+- Bulk saves upsert, and the database runs in WAL mode
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+from app.core.board import Player
+from app.core.menace import Menace
+from app.core.training import play_training_game
+from app.db import database
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """The database module, pointed at a fresh temporary database."""
+    monkeypatch.setattr(database, "DB_PATH", tmp_path / "menace.db")
+    database.init_db()
+    yield database
+    database.close_db()
+
+
+class TestMatchboxStorage:
+    """Test saving and loading matchboxes."""
+
+    def test_save_and_load_matchbox(self, db):
+        """A saved matchbox loads back unchanged (keys become strings)."""
+        db.save_matchbox("X___O____", {1: 3, 2: 3, 5: 1}, times_used=4)
+
+        loaded = db.load_matchbox("X___O____")
+
+        assert loaded == {
+            "board_state": "X___O____",
+            "beads": {"1": 3, "2": 3, "5": 1},
+            "times_used": 4,
+        }
+
+    def test_missing_matchbox(self, db):
+        """Unknown states load as None."""
+        assert db.load_matchbox("_________") is None
+
+    def test_save_and_load_all_matchboxes(self, db):
+        """A bulk save loads back in full."""
+        matchboxes = [
+            {"board_state": "_________", "beads": {0: 4, 1: 4, 4: 4}, "times_used": 9},
+            {"board_state": "X___O____", "beads": {1: 2, 8: 0}, "times_used": 2},
+        ]
+        db.save_all_matchboxes(matchboxes)
+
+        loaded = sorted(db.load_all_matchboxes(), key=lambda mb: mb["board_state"])
+
+        assert loaded == [
+            {"board_state": "X___O____", "beads": {"1": 2, "8": 0}, "times_used": 2},
+            {
+                "board_state": "_________",
+                "beads": {"0": 4, "1": 4, "4": 4},
+                "times_used": 9,
+            },
+        ]
+
+    def test_beads_are_stored_as_compact_json(self, db):
+        """The beads column holds orjson's compact JSON text."""
+        db.save_matchbox("_________", {0: 3, 4: 5})
+
+        with db.get_db() as conn:
+            row = conn.execute("SELECT beads FROM matchboxes").fetchone()
+
+        assert row["beads"] == '{"0":3,"4":5}'
+
+    def test_rows_written_by_json_module_still_load(self, db):
+        """Beads saved with json.dumps' spaced-out format read back the same."""
+        with db.get_db() as conn:
+            conn.execute(
+                "INSERT INTO matchboxes (board_state, beads) VALUES (?, ?)",
+                ("_________", json.dumps({"0": 3, "4": 5})),
+            )
+
+        assert db.load_matchbox("_________")["beads"] == {"0": 3, "4": 5}
+
+
+class TestGameStorage:
+    """Test saving and loading finished games."""
+
+    def test_save_and_load_game(self, db):
+        """A saved game's moves load back unchanged."""
+        moves = [
+            {"player": "X", "position": 4, "board_after": "____X____"},
+            {"player": "O", "position": 0, "board_after": "O___X____"},
+        ]
+        db.save_game("game-1", "win", "X", moves)
+
+        (game,) = db.get_game_history()
+
+        assert game["id"] == "game-1"
+        assert game["result"] == "win"
+        assert game["menace_player"] == "X"
+        assert game["moves"] == moves
+
+
+class TestCheckpoint:
+    """Test saving MENACE's whole state as one checkpoint row."""
+
+    @staticmethod
+    def trained_menace() -> Menace:
+        """A MENACE that has learned from a few games."""
+        menace = Menace(player=Player.X, seed=7)
+        for i in range(20):
+            moves, result = play_training_game(menace, menace_first=i % 2 == 0)
+            menace.learn_from(moves, result)
+        return menace
+
+    def test_no_checkpoint_yet(self, db):
+        """Loading before anything was saved gives None."""
+        assert db.load_menace_checkpoint() is None
+
+    def test_checkpoint_round_trip(self, db):
+        """The checkpoint restores an identical MENACE."""
+        state = self.trained_menace().to_dict()
+
+        db.save_menace_checkpoint(state)
+        loaded = db.load_menace_checkpoint()
+
+        assert loaded["games_played"] == 20
+        assert loaded.keys() == state.keys()
+        assert Menace.from_dict(loaded).to_dict() == state
+
+    def test_checkpoint_is_replaced(self, db):
+        """Saving again overwrites the single checkpoint row."""
+        db.save_menace_checkpoint(Menace(player=Player.X).to_dict())
+        db.save_menace_checkpoint(self.trained_menace().to_dict())
+
+        with db.get_db() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM menace_checkpoint").fetchone()
+
+        assert count[0] == 1
+        assert db.load_menace_checkpoint()["games_played"] == 20
+
+    def test_reset_db_drops_checkpoint(self, db):
+        """reset_db removes the checkpoint along with everything else."""
+        db.save_menace_checkpoint(self.trained_menace().to_dict())
+
+        db.reset_db()
+
+        assert db.load_menace_checkpoint() is None
+        with db.get_db() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM menace_checkpoint").fetchone()
+        assert count[0] == 0
+
+
+class TestConnections:
+    """Test the per-thread connection behind get_db()."""
+
+    def test_connection_is_reused(self, db):
+        """Consecutive get_db() blocks share one open connection."""
+        with db.get_db() as first:
+            pass
+        with db.get_db() as second:
+            second.execute("SELECT 1")
+
+        assert first is second
+
+    def test_each_thread_has_its_own_connection(self, db):
+        """SQLite connections aren't shared across threads."""
+        with db.get_db() as here:
+            pass
+
+        seen = []
+
+        def worker():
+            with db.get_db() as conn:
+                seen.append(conn)
+            db.close_db()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen and seen[0] is not here
+
+    def test_reopens_when_db_path_changes(self, db, tmp_path, monkeypatch):
+        """Pointing DB_PATH elsewhere closes the old connection."""
+        with db.get_db() as old:
+            pass
+
+        monkeypatch.setattr(db, "DB_PATH", tmp_path / "other.db")
+        with db.get_db() as new:
+            new.execute("SELECT 1")
+
+        assert new is not old
+        with pytest.raises(sqlite3.ProgrammingError):
+            old.execute("SELECT 1")
+        assert (tmp_path / "other.db").exists()
+
+    def test_error_rolls_back(self, db):
+        """An exception inside the block undoes the block's writes."""
+        with pytest.raises(RuntimeError):
+            with db.get_db() as conn:
+                conn.execute(
+                    "INSERT INTO matchboxes (board_state, beads) VALUES (?, ?)",
+                    ("_________", "{}"),
+                )
+                raise RuntimeError("boom")
+
+        assert db.load_matchbox("_________") is None
+
+    def test_success_commits(self, db):
+        """Writes are committed, so another connection can see them."""
+        db.save_matchbox("_________", {0: 3})
+
+        other = sqlite3.connect(str(db.DB_PATH))
+        try:
+            row = other.execute("SELECT beads FROM matchboxes").fetchone()
+        finally:
+            other.close()
+
+        assert row == ('{"0":3}',)
+
+    def test_close_db(self, db):
+        """close_db closes the connection; the next block opens a new one."""
+        with db.get_db() as old:
+            pass
+
+        db.close_db()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            old.execute("SELECT 1")
+        with db.get_db() as new:
+            new.execute("SELECT 1")
+        assert new is not old
+
+    def test_close_db_without_connection(self, db):
+        """Closing twice is harmless."""
+        db.close_db()
+        db.close_db()
+
+
+class TestBulkSave:
+    """Test the executemany() upsert and the journal settings."""
+
+    def test_bulk_save_updates_existing_rows(self, db):
+        """Saving a stored board state again replaces it, no duplicates."""
+        db.save_matchbox("_________", {0: 3, 4: 3}, times_used=1)
+
+        db.save_all_matchboxes(
+            [
+                {"board_state": "_________", "beads": {0: 1, 4: 9}, "times_used": 5},
+                {"board_state": "X___O____", "beads": {1: 3}, "times_used": 1},
+            ]
+        )
+
+        loaded = {mb["board_state"]: mb for mb in db.load_all_matchboxes()}
+        assert len(loaded) == 2
+        assert loaded["_________"]["beads"] == {"0": 1, "4": 9}
+        assert loaded["_________"]["times_used"] == 5
+
+    def test_bulk_save_is_one_transaction(self, db):
+        """A bad row leaves none of the batch behind."""
+        with pytest.raises(KeyError):
+            db.save_all_matchboxes(
+                [
+                    {"board_state": "_________", "beads": {0: 3}, "times_used": 0},
+                    {"board_state": "X___O____", "beads": {1: 3}},
+                ]
+            )
+
+        assert db.load_all_matchboxes() == []
+
+    def test_bulk_save_of_nothing(self, db):
+        """An empty list is a no-op."""
+        db.save_all_matchboxes([])
+
+        assert db.load_all_matchboxes() == []
+
+    def test_wal_mode(self, db):
+        """init_db switches the database file to write-ahead logging."""
+        with db.get_db() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        assert mode == "wal"
+        # 1 is NORMAL
+        assert synchronous == 1
+
+    def test_wal_mode_is_stored_in_the_file(self, db):
+        """Fresh connections to the file find it in WAL mode already."""
+        db.close_db()
+
+        conn = sqlite3.connect(str(db.DB_PATH))
+        try:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+
+        assert mode == "wal"
@@ -0,0 +1,138 @@
+"""
+Tests for the Game module.
+
+These tests verify that a Game session correctly:
+- Tracks turns and moves
+- Caches its API-facing snapshot until the next move
+"""
+
+import sys
+
+import pytest
+
+from app.core.board import Board, Player, GameResult
+from app.core.game import Game, GameManager, GameState, Move
+from app.core.menace import Menace
+
+
+class TestMove:
+    """Test the per-move record."""
+
+    def test_move_to_dict(self):
+        """Moves serialize with an ISO timestamp."""
+        # Mid-July 1970, whatever the local time zone
+        move = Move(
+            player=Player.X, position=4, board_after="____X____", timestamp=200 * 86400
+        )
+        data = move.to_dict()
+
+        assert data["player"] == "X"
+        assert data["position"] == 4
+        assert data["timestamp"].startswith("1970-07-")
+
+    @pytest.mark.skipif(
+        sys.version_info < (3, 10), reason="dataclass slots need Python 3.10"
+    )
+    def test_move_has_no_instance_dict(self):
+        """Moves use __slots__ to stay small."""
+        move = Move(player=Player.O, position=0, board_after="O________")
+        assert not hasattr(move, "__dict__")
+
+    def test_moves_compare_by_value(self):
+        """Moves are dataclasses, so equal fields mean equal moves."""
+        first = Move(Player.X, 4, "____X____", timestamp=1.0)
+        same = Move(Player.X, 4, "____X____", timestamp=1.0)
+        later = Move(Player.X, 4, "____X____", timestamp=2.0)
+
+        assert first == same
+        assert first != later
+
+
+class TestGameSnapshot:
+    """Test the cached GameView returned by Game.snapshot()."""
+
+    def test_snapshot_of_new_game(self):
+        """A fresh game should be waiting for MENACE with all moves open."""
+        game = Game(menace=Menace(player=Player.X))
+        view = game.snapshot()
+
+        assert view.board == Board.EMPTY
+        assert view.state == GameState.WAITING_FOR_MENACE
+        assert view.is_over is False
+        assert view.valid_moves == tuple(range(9))
+        assert view.winner is None
+        assert view.result is None
+
+    def test_snapshot_is_cached(self):
+        """Repeated calls without a move should return the same object."""
+        game = Game(menace=Menace(player=Player.X))
+        assert game.snapshot() is game.snapshot()
+
+    def test_snapshot_invalidated_by_move(self):
+        """Playing a move should produce a fresh snapshot."""
+        game = Game(menace=Menace(player=Player.X))
+        before = game.snapshot()
+
+        position, _ = game.menace_move()
+        after = game.snapshot()
+
+        assert after is not before
+        assert after.board == game.board.state
+        assert after.state == GameState.WAITING_FOR_OPPONENT
+        assert position not in after.valid_moves
+
+    def test_snapshot_of_finished_game(self):
+        """A finished game should report its winner and result."""
+        game = Game(menace=Menace(player=Player.O), board=Board("XX_OO____"))
+        game.opponent_move(2)
+        view = game.snapshot()
+
+        assert view.state == GameState.FINISHED
+        assert view.is_over is True
+        assert view.valid_moves == ()
+        assert view.winner == Player.X
+        assert view.result == GameResult.LOSS
+
+
+class TestGameManager:
+    """Test the bounded game store."""
+
+    def test_finish_moves_game_to_finished(self):
+        """Finished games leave the active set but can still be fetched."""
+        manager = GameManager(menace=Menace(player=Player.X))
+        game = manager.create_game(menace_plays_first=True)
+        assert list(manager.get_active_games()) == [game]
+
+        while not game.is_over():
+            if game.is_menace_turn():
+                game.menace_move()
+            else:
+                game.opponent_move(game.get_valid_moves()[0])
+        manager.finish_game(game.id)
+
+        assert len(manager.get_active_games()) == 0
+        assert manager.get_game(game.id) is game
+        assert manager.menace.games_played == 1
+
+    def test_finish_game_learns_once(self):
+        """Finishing the same game twice should only learn once."""
+        manager = GameManager(menace=Menace(player=Player.X))
+        game = manager.create_game(menace_plays_first=False)
+        game.board = Board("XXX______")
+
+        manager.finish_game(game.id)
+        manager.finish_game(game.id)
+
+        assert manager.menace.games_played == 1
+
+    def test_active_games_are_bounded(self):
+        """The oldest active game is evicted past the cap."""
+        manager = GameManager(menace=Menace(player=Player.X))
+        manager.MAX_ACTIVE_GAMES = 2
+
+        first = manager.create_game()
+        manager.create_game()
+        manager.create_game()
+
+        assert len(manager.get_active_games()) == 2
+        assert manager.get_game(first.id) is None
@@ -7,6 +7,8 @@ These tests verify that the MENACE algorithm correctly:
 - Learns from game outcomes
 """
 
+import random
+
 import pytest
 from app.core.menace import Menace, Matchbox, MoveRecord
 from app.core.board import Board, Player, GameResult
@@ -57,6 +59,14 @@ class TestMatchbox:
         assert matchbox.beads[4] == 5
         assert matchbox.beads[0] == 3  # Unchanged
 
+    def test_add_beads_is_not_clamped(self):
+        """A negative count is applied as given, like it always was."""
+        matchbox = Matchbox(board_state="_________", beads={0: 3, 4: 3})
+
+        assert matchbox.add_beads(4, -5) == -5
+        assert matchbox.beads[4] == -2
+        assert matchbox.get_total_beads() == 1
+
     def test_remove_beads(self):
         """Should correctly remove beads."""
         matchbox = Matchbox(board_state="_________", beads={0: 5, 4: 3})
@@ -71,11 +81,37 @@ class TestMatchbox:
 
         assert matchbox.beads[0] == 1  # Not 0 or negative
 
+    def test_apply_delta(self):
+        """A signed delta adds or removes beads, respecting the minimum."""
+        matchbox = Matchbox(board_state="_________", beads={0: 3, 4: 3})
+
+        assert matchbox.apply_delta(0, 3) == 3
+        assert matchbox.apply_delta(4, -5, min_beads=1) == -2
+        assert matchbox.beads == {0: 6, 4: 1}
+        assert matchbox.get_total_beads() == 7
+
     def test_get_total_beads(self):
         """Should correctly count total beads."""
         matchbox = Matchbox(board_state="_________", beads={0: 3, 4: 5, 8: 2})
         assert matchbox.get_total_beads() == 10
 
+    def test_total_beads_tracks_changes(self):
+        """The running total should follow add_beads/remove_beads."""
+        matchbox = Matchbox(board_state="_________", beads={0: 3, 4: 5})
+        matchbox.add_beads(0, 3)
+        matchbox.remove_beads(4, 10, min_beads=1)
+        matchbox.add_beads(7, 5)  # Not a valid move here - ignored
+
+        assert matchbox.get_total_beads() == sum(matchbox.beads.values()) == 7
+
+    def test_draw_bead_covers_every_bead(self):
+        """Each bead should map to its own position, in order."""
+        matchbox = Matchbox(board_state="_________", beads={0: 2, 4: 3})
+        # Aim the random number at the middle of each bead in turn
+        drawn = [matchbox.draw_bead(lambda: (n + 0.5) / 5) for n in range(5)]
+
+        assert drawn == [0, 0, 4, 4, 4]
+
     def test_get_probabilities(self):
         """Should correctly calculate probabilities."""
         matchbox = Matchbox(board_state="_________", beads={0: 2, 4: 6, 8: 2})
@@ -85,6 +121,31 @@ class TestMatchbox:
         assert probs[4] == 0.6
         assert probs[8] == 0.2
 
+    def test_top_move(self):
+        """Top move should follow bead changes."""
+        matchbox = Matchbox(board_state="_________", beads={0: 3, 4: 5, 8: 2})
+        assert matchbox.top_move == 4
+
+        matchbox.add_beads(8, 10)
+        assert matchbox.top_move == 8
+
+        matchbox.remove_beads(8, 10)
+        assert matchbox.top_move == 4
+
+    def test_probabilities_cached_until_beads_change(self):
+        """get_probabilities() should be reused until beads change."""
+        matchbox = Matchbox(board_state="_________", beads={0: 1, 4: 3})
+        first = matchbox.get_probabilities()
+        assert matchbox.get_probabilities() is first
+
+        matchbox.add_beads(0, 2)
+
+        assert matchbox.get_probabilities() == {0: 0.5, 4: 0.5}
+
+    def test_top_move_empty(self):
+        """An empty matchbox has no top move."""
+        assert Matchbox(board_state="XOXOXOOXO").top_move is None
+
     def test_serialization(self):
         """Should serialize and deserialize correctly."""
         matchbox = Matchbox(board_state="X________", beads={1: 3, 4: 5}, times_used=10)
@@ -130,6 +191,22 @@ class TestMenace:
         assert len(menace.move_history) == 1
         assert isinstance(menace.move_history[0], MoveRecord)
 
+    def test_move_record_is_slotted(self):
+        """MoveRecords use __slots__ but still compare by value."""
+        record = MoveRecord("_________", 4, 0)
+
+        assert not hasattr(record, "__dict__")
+        assert record == MoveRecord("_________", 4, 0)
+        assert record != MoveRecord("_________", 0, 0)
+
+    def test_seed_makes_moves_reproducible(self):
+        """Two MENACEs with the same seed should draw the same beads."""
+        first = Menace(player=Player.X, seed=42)
+        second = Menace(player=Player.X, seed=42)
+
+        for board in (Board(), Board("X___O____"), Board("XO__X___O")):
+            assert first.get_move(board) == second.get_move(board)
+
     def test_get_move_returns_valid_position(self):
         """Move should be a valid empty position."""
         menace = Menace(player=Player.X)
@@ -186,6 +263,120 @@ class TestMenace:
         assert menace.losses == 0
         assert menace.draws == 0
 
+    def test_version_changes_on_writes(self):
+        """Moves and learning should bump the version counter."""
+        menace = Menace(player=Player.X)
+        v0 = menace.version
+
+        menace.get_move(Board())
+        v1 = menace.version
+        assert v1 != v0
+
+        menace.learn(GameResult.WIN)
+        assert menace.version != v1
+
+    def test_statistics_cached_until_change(self):
+        """Statistics should be reused until MENACE changes."""
+        menace = Menace(player=Player.X)
+        first = menace.get_statistics()
+        assert menace.get_statistics() is first
+
+        menace.get_move(Board())
+        menace.learn(GameResult.WIN)
+        stats = menace.get_statistics()
+
+        assert stats is not first
+        assert stats.games_played == 1
+        assert stats.wins == 1
+        assert stats.matchbox_count == 1
+        assert stats.total_beads == menace.get_total_beads()
+
+    def test_total_beads_tracks_learning(self):
+        """The running bead total should match a full recount."""
+        menace = Menace(player=Player.X)
+        for result in (GameResult.WIN, GameResult.LOSS, GameResult.LOSS):
+            menace.get_move(Board())
+            menace.get_move(Board("XO_______"))
+            menace.learn(result)
+
+        recount = sum(sum(mb.beads.values()) for mb in menace.matchboxes.values())
+        assert menace.get_total_beads() == recount
+        assert Menace.from_dict(menace.to_dict()).get_total_beads() == recount
+
+    def test_learn_from_matches_learn(self):
+        """Learning from handed-back moves should match learn()."""
+        kept = Menace(player=Player.X)
+        handed_back = Menace(player=Player.X)
+        results = [GameResult.WIN, GameResult.LOSS, GameResult.LOSS, GameResult.DRAW]
+
+        for result in results:
+            for menace in (kept, handed_back):
+                menace.get_move(Board())
+                menace.get_move(Board("XO_______"))
+            # Use the same positions for both so the outcomes are comparable
+            moves = [
+                MoveRecord(m.board_state, m.position, m.transform_idx)
+                for m in kept.move_history
+            ]
+            handed_back.move_history = []
+            kept.learn(result)
+            handed_back.learn_from(moves, result)
+
+        assert handed_back.get_statistics() == kept.get_statistics()
+        assert handed_back.history == kept.history
+        for state, matchbox in kept.matchboxes.items():
+            assert handed_back.matchboxes[state].beads == matchbox.beads
+
+    def test_get_history_pages(self):
+        """get_history should return just the requested slice as dicts."""
+        menace = Menace(player=Player.X)
+        for _ in range(5):
+            menace.get_move(Board())
+            menace.learn(GameResult.DRAW)
+
+        page = menace.get_history(since=1, limit=2)
+
+        assert [point["games"] for point in page] == [2, 3]
+        assert len(menace.get_history()) == 5
+        assert menace.get_history(since=5) == []
+
+    def test_history_survives_round_trip(self):
+        """History points should persist through to_dict/from_dict."""
+        menace = Menace(player=Player.X)
+        menace.get_move(Board())
+        menace.learn(GameResult.WIN)
+
+        restored = Menace.from_dict(menace.to_dict())
+
+        assert restored.history == menace.history
+
+    def test_history_snapshot_schedule(self):
+        """Every game to 100, every 10th to 1000, then every 100th."""
+        menace = Menace(player=Player.X)
+        for _ in range(1200):
+            menace.learn_from([], GameResult.DRAW)
+
+        games = [point.games for point in menace.history]
+        assert games[:100] == list(range(1, 101))
+        assert games[100:] == list(range(110, 1001, 10)) + [1100, 1200]
+
+        # A restored MENACE carries on with the same schedule
+        restored = Menace.from_dict(menace.to_dict())
+        for _ in range(100):
+            restored.learn_from([], GameResult.DRAW)
+        assert restored.history[-1].games == 1300
+        assert len(restored.history) == len(menace.history) + 1
+
+    def test_get_matchbox_data(self):
+        """Lookups normalize the board and return the matchbox with its data."""
+        menace = Menace(player=Player.X)
+        menace.get_move(Board("X________"))
+
+        matchbox, data = menace.get_matchbox_data("__X______")
+
+        assert matchbox is menace.matchboxes[data["board_state"]]
+        assert menace.get_matchbox_data("XO_______") is None
+
     def test_reset_game(self):
         """Reset should clear move history."""
         menace = Menace(player=Player.X)
@@ -238,20 +429,19 @@ class TestMenaceIntegration:
 
     def test_play_full_game(self):
         """MENACE should be able to play a complete game."""
-        menace = Menace(player=Player.X)
+        menace = Menace(player=Player.X, seed=42)
+        rng = random.Random(42)
         board = Board()
         moves_made = 0
 
         # Simulate a game (X=MENACE, O=random)
-        import random
-
         current_player = Player.X
 
         while not board.is_game_over() and moves_made < 9:
             if current_player == menace.player:
                 move = menace.get_move(board)
             else:
-                move = random.choice(board.get_empty_positions())
+                move = rng.choice(board.get_empty_positions())
 
             board = board.make_move(move, current_player)
             current_player = current_player.other
@@ -268,11 +458,11 @@ class TestMenaceIntegration:
 
     def test_learning_improves_over_time(self):
         """MENACE should generally improve with training."""
-        menace = Menace(player=Player.X)
+        # Seeded, so the run is the same every time
+        menace = Menace(player=Player.X, seed=42)
+        rng = random.Random(42)
 
         # Play many games against random opponent
-        import random
-
         early_wins = 0
         late_wins = 0
 
@@ -284,7 +474,7 @@ class TestMenaceIntegration:
                 if current_player == menace.player:
                     move = menace.get_move(board)
                 else:
-                    move = random.choice(board.get_empty_positions())
+                    move = rng.choice(board.get_empty_positions())
                 board = board.make_move(move, current_player)
                 current_player = current_player.other
 
@@ -0,0 +1,93 @@
+"""
+Tests for the self-play training loop.
+
+These tests verify that play_training_game:
+- Plays legal, complete games
+- Reports results from MENACE's perspective
+- Leaves learning to the caller
+- Replays the same games from the same random sources
+"""
+
+import random
+
+from app.api.routes import _run_training
+from app.core.board import Board, Player, GameResult
+from app.core.game import GameManager
+from app.core.menace import Menace
+from app.core.training import play_training_game
+
+
+class TestPlayTrainingGame:
+    """Test the fast self-play game loop."""
+
+    def test_game_does_not_learn(self):
+        """MENACE's moves are returned, not learned from."""
+        menace = Menace(player=Player.X)
+        moves, result = play_training_game(menace, menace_first=True)
+
+        assert 3 <= len(moves) <= 5
+        assert result != GameResult.IN_PROGRESS
+        assert menace.games_played == 0
+        assert menace.move_history == []
+
+    def test_menace_plays_second(self):
+        """When MENACE goes second it plays O."""
+        menace = Menace(player=Player.X)
+        moves, _ = play_training_game(menace, menace_first=False)
+
+        assert menace.player == Player.O
+        # Every board MENACE saw had one more X than O
+        for move in moves:
+            assert move.board_state.count("X") == move.board_state.count("O") + 1
+
+    def test_menace_never_moves_on_finished_board(self):
+        """Every board MENACE was asked about was still in play."""
+        menace = Menace(player=Player.X)
+        for _ in range(50):
+            moves, result = play_training_game(menace, menace_first=True)
+            # MENACE never moves on a finished board
+            for move in moves:
+                assert not Board(move.board_state).is_game_over()
+            menace.learn_from(moves, result)
+
+        assert menace.games_played == 50
+        assert menace.wins + menace.losses + menace.draws == 50
+
+    def test_seeded_games_repeat(self):
+        """The same MENACE seed and bot source play the same games."""
+
+        def play():
+            menace = Menace(player=Player.X, seed=3)
+            rng = random.Random(5)
+            return [
+                play_training_game(menace, menace_first=True, rand=rng.random)
+                for _ in range(20)
+            ]
+
+        assert play() == play()
+
+
+class TestRunTraining:
+    """Test the training loop behind /training/self-play."""
+
+    def test_seeded_training_repeats(self):
+        """A seeded MENACE and bot give identical training runs."""
+
+        def train():
+            manager = GameManager(menace=Menace(player=Player.X, seed=11))
+            results = _run_training(manager, 200, random.Random(4))
+            return results, manager.menace.to_dict()
+
+        assert train() == train()
+
+    def test_learns_from_every_game(self):
+        """Each game is learned from before the next is played."""
+        manager = GameManager(menace=Menace(player=Player.X, seed=1))
+
+        wins, losses, draws = _run_training(manager, 50, random.Random(2))
+
+        menace = manager.menace
+        assert wins + losses + draws == 50
+        assert menace.games_played == 50
+        assert (menace.wins, menace.losses, menace.draws) == (wins, losses, draws)
+        assert len(menace.history) == 50